@@ -25,9 +25,14 @@ setup(
         "dev": [
             "pytest",
             "pytest-asyncio",
+            "pytest-xdist",
             "ruff",
             "mypy",
         ],
+        "fast": [
+            "blake3>=0.4",
+            "orjson>=3",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -7,9 +7,15 @@ import platform
 import logging
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
 from jinja2 import Environment, FileSystemLoader
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
 from .automation import FileOrganizer
 from .context import DirectoryContextBuilder
 from .ai_utils import AIExecutor
@@ -18,11 +24,30 @@ from .ai_schema import PLAN_SCHEMA, TAGS_SCHEMA, SEMANTIC_SEARCH_SCHEMA
 
 logger = logging.getLogger(__name__)
 
+
+def _compile_schema(schema: Dict[str, Any]):
+    """Check a schema once and return a reusable validator for it."""
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+# jsonschema.validate() re-checks the schema and builds a validator on every
+# call; the schemas are fixed, so do that once at import instead.
+_PLAN_VALIDATOR = _compile_schema(PLAN_SCHEMA)
+_TAGS_VALIDATOR = _compile_schema(TAGS_SCHEMA)
+_SEARCH_VALIDATOR = _compile_schema(SEMANTIC_SEARCH_SCHEMA)
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only
+# need to handle the latter whichever parser is in use.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
 class ResponseValidator:
     """Validates AI responses against JSON schemas."""
 
     @staticmethod
-    def _validate(response_text: str, schema: Dict[str, Any], schema_name: str) -> Dict[str, Any]:
+    def _validate(response_text: str, validator, schema_name: str) -> Dict[str, Any]:
         """Generic validation helper."""
         try:
             # clean markdown code blocks
@@ -33,8 +58,8 @@ class ResponseValidator:
             if start != -1 and end != -1:
                 clean_text = clean_text[start:end+1]
 
-            data = json.loads(clean_text)
-            validate(instance=data, schema=schema)
+            data = _json_loads(clean_text)
+            validator.validate(data)
             return data
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid {schema_name} format (JSON Decode Error): {str(e)}")
@@ -44,17 +69,17 @@ class ResponseValidator:
     @staticmethod
     def validate_plan(response_text: str) -> Dict[str, Any]:
         """Validate and parse a planning response."""
-        return ResponseValidator._validate(response_text, PLAN_SCHEMA, "plan")
+        return ResponseValidator._validate(response_text, _PLAN_VALIDATOR, "plan")
 
     @staticmethod
     def validate_tags(response_text: str) -> Dict[str, Any]:
         """Validate and parse a tagging response."""
-        return ResponseValidator._validate(response_text, TAGS_SCHEMA, "tags")
+        return ResponseValidator._validate(response_text, _TAGS_VALIDATOR, "tags")
 
     @staticmethod
     def validate_search(response_text: str) -> Dict[str, Any]:
         """Validate and parse a semantic search response."""
-        return ResponseValidator._validate(response_text, SEMANTIC_SEARCH_SCHEMA, "search")
+        return ResponseValidator._validate(response_text, _SEARCH_VALIDATOR, "search")
 
 
 class GeminiClient:
@@ -4,21 +4,100 @@ Automation features for file organization and management.
 
 import asyncio
 import hashlib
+import mmap
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Callable, Optional, Iterator
+from typing import Dict, List, Callable, Mapping, Optional, Iterator, Sequence, Set, Union
 from datetime import datetime
 from enum import Enum, auto
 import os
-from .utils import recursive_scan
+import threading
+from .utils import map_in_pool, recursive_scan
 from .config import ConfigManager
 from .file_operations import FileOperations
 from .logger import get_logger
 
+try:
+    from blake3 import blake3 as _blake3  # type: ignore[import-not-found]
+except ImportError:  # optional dependency
+    _blake3 = None
+
 logger = get_logger("automation")
 
 
 # Constants
 SECONDS_PER_DAY = 86400
+# Upper bound on soft-deletes in flight at once; each one occupies a worker
+# thread for the duration of its rename into the trash.
+MAX_CONCURRENT_DELETES = 32
+# resolve_duplicates deletes within already-hashed groups, so it can afford more
+MAX_CONCURRENT_DUPLICATE_DELETES = 64
+# Bytes read from each end of a file for the partial-hash pass
+PARTIAL_HASH_SIZE = 4096
+# Read size for the full-hash pass
+FULL_HASH_CHUNK_SIZE = 1024 * 1024
+# Files at least this large are handed to blake3's mmap-backed,
+# multithreaded hasher instead of the read loop
+BLAKE3_MMAP_THRESHOLD = 16 * 1024 * 1024
+# Files at least this large are hashed from an mmap rather than read()
+MMAP_HASH_THRESHOLD = 4 * 1024 * 1024
+# Largest slice of a mapping passed to a single hasher.update() call
+MMAP_HASH_SLICE = 128 * 1024 * 1024
+# Files handed to each pool task in the partial-hash pass; full hashes are
+# submitted one file per task since each is already a sizeable read.
+PARTIAL_HASH_BATCH_SIZE = 64
+
+
+def _fadvise(fd: int, advice_name: str, offset: int = 0, length: int = 0) -> None:
+    """Pass a read hint to the kernel where posix_fadvise exists (length 0 = to EOF)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, offset, length, getattr(os, advice_name))
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _device_is_rotational(dev: int) -> bool:
+    """Whether the block device behind st_dev reports itself as a spinning disk."""
+    base = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+    # Partitions keep the queue attributes on their parent disk
+    for queue_dir in (f"{base}/queue", f"{base}/../queue"):
+        try:
+            with open(f"{queue_dir}/rotational") as f:
+                return f.read().strip() == "1"
+        except OSError:
+            continue
+    return False
+
+
+def _is_rotational(path: Union[str, Path]) -> bool:
+    """Whether path lives on a rotational disk; False when it can't be told."""
+    try:
+        return _device_is_rotational(os.stat(path).st_dev)
+    except OSError:
+        return False
+
+
+_read_buffers = threading.local()
+
+
+def _read_buffer(size: int) -> memoryview:
+    """A per-thread scratch buffer of at least size bytes, reused across files."""
+    buf = getattr(_read_buffers, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = bytearray(size)
+        _read_buffers.buf = buf
+    return memoryview(buf)[:size]
+
+
+def _new_hasher():
+    """Return a content hasher: BLAKE3 when installed, else BLAKE2b."""
+    if _blake3 is not None:
+        return _blake3()
+    return hashlib.blake2b()
 
 class ConflictResolutionStrategy(Enum):
     KEEP_NEWEST = auto()
@@ -31,6 +110,14 @@ class ConflictResolutionStrategy(Enum):
 class FileOrganizer:
     """Handles automated file organization tasks."""
 
+    # Strategy -> (selector, stat attribute) used to choose the file to keep
+    _KEEP_RULES = {
+        ConflictResolutionStrategy.KEEP_NEWEST: (max, "st_mtime"),
+        ConflictResolutionStrategy.KEEP_OLDEST: (min, "st_mtime"),
+        ConflictResolutionStrategy.KEEP_LARGEST: (max, "st_size"),
+        ConflictResolutionStrategy.KEEP_SMALLEST: (min, "st_size"),
+    }
+
     def __init__(self):
         self.organized_files: Dict[str, List[Path]] = {}
         self.config_manager = ConfigManager()
@@ -60,10 +147,13 @@ class FileOrganizer:
         else:
             extension_map = self._build_extension_map(categories)
 
+        # Bind the lookup once; classification is then a single dict probe per file
+        lookup = extension_map.get
+
         return await self._organize_generic(
             source_dir,
             target_dir,
-            lambda p: self._get_file_category(p, extension_map),
+            lambda entry: lookup(os.path.splitext(entry.name)[1].lower()),
             move,
             dry_run,
             progress_queue
@@ -81,10 +171,10 @@ class FileOrganizer:
         """
         Organize files by modification date into date-based subdirectories.
         """
-        def get_date_key(file_path: Path) -> str:
-            mtime = file_path.stat().st_mtime
-            date = datetime.fromtimestamp(mtime)
-            return date.strftime(date_format)
+        def get_date_key(entry: os.DirEntry) -> str:
+            # The entry caches its stat, so this is the file's only stat call
+            mtime = entry.stat().st_mtime
+            return datetime.fromtimestamp(mtime).strftime(date_format)
 
         return await self._organize_generic(
             source_dir,
@@ -99,45 +189,66 @@ class FileOrganizer:
         self,
         source_dir: Path,
         target_dir: Path,
-        key_func: Callable[[Path], Optional[str]],
+        key_func: Callable[[os.DirEntry], Optional[str]],
         move: bool,
         dry_run: bool,
         progress_queue: Optional[asyncio.Queue] = None
     ) -> Dict[str, List[Path]]:
         """
         Generic method to organize files based on a key generation function.
+        key_func receives the source file's os.DirEntry.
         """
         organized: Dict[str, List[Path]] = {}
+        # Destination directory per key, or None if the key escapes target_dir.
+        # Validated (and created) once per key instead of once per file.
+        key_dirs: Dict[str, Optional[Path]] = {}
+        # Names already taken in each destination, listed once per key so
+        # picking a free "_N" name needs no per-candidate stat.
+        key_names: Dict[str, Set[str]] = {}
 
         if not dry_run:
             await self.file_ops.create_directory(target_dir, exist_ok=True)
+        resolved_target = target_dir.resolve()
 
         try:
-            files = list(source_dir.iterdir())
+            with os.scandir(source_dir) as it:
+                entries = list(it)
         except OSError:
              return {}
         
-        for file_path in files:
-            if not file_path.is_file():
+        for entry in entries:
+            try:
+                # d_type answers is_file() without a stat on most filesystems
+                if not entry.is_file():
+                    continue
+                key = key_func(entry)
+            except OSError as e:
+                logger.debug(f"Failed to classify {entry.path}: {e}")
                 continue
-            
-            key = key_func(file_path)
             if not key:
                 continue
 
-            key_dir = target_dir / key
-            
-            try:
-                if not key_dir.resolve().is_relative_to(target_dir.resolve()):
-                    continue
-            except (ValueError, RuntimeError):
-                continue
+            file_path = Path(entry.path)
 
-            if not dry_run and not key_dir.exists():
-                await self.file_ops.create_directory(key_dir, exist_ok=True)
+            if key not in key_dirs:
+                candidate = target_dir / key
+                try:
+                    valid = candidate.resolve().is_relative_to(resolved_target)
+                except (ValueError, RuntimeError):
+                    valid = False
+                if valid and not dry_run and not candidate.exists():
+                    await self.file_ops.create_directory(candidate, exist_ok=True)
+                key_dirs[key] = candidate if valid else None
+                if valid:
+                    key_names[key] = self._list_names(candidate)
+
+            key_dir = key_dirs[key]
+            if key_dir is None:
+                continue
             
-            target_path = key_dir / file_path.name
-            target_path = self._get_unique_path(target_path)
+            taken = key_names[key]
+            target_path = self._get_unique_path(key_dir / file_path.name, taken)
+            taken.add(target_path.name)
             
             try:
                 if not dry_run:
@@ -176,29 +287,53 @@ class FileOrganizer:
         cutoff_time = datetime.now().timestamp() - (days_old * SECONDS_PER_DAY)
         
         def collect_old_files() -> List[Path]:
-            old = []
-            for file_path in self._iter_files(directory, recursive):
+            # Work on DirEntry objects so only matching files become Paths
+            old: List[Path] = []
+            append = old.append
+            for entry in self._iter_entries(directory, recursive):
                 try:
-                    if file_path.stat().st_mtime < cutoff_time:
-                        old.append(file_path)
+                    if entry.is_file() and entry.stat().st_mtime < cutoff_time:
+                        append(Path(entry.path))
                 except OSError as e:
-                    logger.debug(f"Failed to process {file_path} for cleanup: {e}")
+                    logger.debug(f"Failed to process {entry.path} for cleanup: {e}")
             return old
 
         old_files = await asyncio.to_thread(collect_old_files)
 
-        for file_path in old_files:
-            try:
-                if not dry_run:
-                    await self.file_ops.delete(file_path)
-
-                if progress_queue:
+        if dry_run:
+            if progress_queue:
+                for file_path in old_files:
                     await progress_queue.put(file_path)
-            except OSError as e:
-                logger.debug(f"Failed to process {file_path} for cleanup: {e}")
-                continue
-        
+            return old_files
+
+        await self._delete_many(old_files, progress_queue)
         return old_files
+
+    async def _delete_many(
+        self,
+        paths: List[Path],
+        progress_queue: Optional[asyncio.Queue] = None,
+        max_concurrent: int = MAX_CONCURRENT_DELETES
+    ) -> List[Path]:
+        """
+        Delete files concurrently, bounded by a semaphore.
+        Returns the paths that were deleted, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def delete_one(file_path: Path) -> bool:
+            async with semaphore:
+                try:
+                    await self.file_ops.delete(file_path)
+                except Exception as e:
+                    logger.warning(f"Failed to delete {file_path}: {e}")
+                    return False
+            if progress_queue:
+                await progress_queue.put(file_path)
+            return True
+
+        results = await asyncio.gather(*(delete_one(p) for p in paths))
+        return [p for p, ok in zip(paths, results) if ok]
     
     async def find_duplicates(
         self,
@@ -218,8 +353,11 @@ class FileOrganizer:
     ) -> Dict[str, List[Path]]:
         """Sync implementation of find_duplicates with 3-pass strategy."""
         
+        # Paths stay as the str from DirEntry.path until the result is built,
+        # so files that turn out to be unique never get a Path object.
+
         # Pass 1: Group by Size
-        size_groups: Dict[int, List[Path]] = {}
+        size_groups: Dict[int, List[str]] = defaultdict(list)
         try:
             entries: Iterator[os.DirEntry[str]]
             if recursive:
@@ -232,10 +370,7 @@ class FileOrganizer:
 
             for entry in entries:
                 try:
-                    size = entry.stat().st_size
-                    if size not in size_groups:
-                        size_groups[size] = []
-                    size_groups[size].append(Path(entry.path))
+                    size_groups[entry.stat().st_size].append(entry.path)
                 except OSError:
                     continue
         except (PermissionError, OSError) as e:
@@ -244,47 +379,76 @@ class FileOrganizer:
         # Filter for possible duplicates (more than 1 file with same size)
         candidates_by_size = {s: files for s, files in size_groups.items() if len(files) > 1}
 
-        # Pass 2: Partial Hash (first/last 64KB)
-        partial_groups: Dict[str, List[Path]] = {}
+        # Concurrent reads make a spinning disk seek between files, which
+        # costs far more than the hashing saves; read one file at a time there.
+        sequential = _is_rotational(directory)
+
+        # Pass 2: Partial Hash (first/last PARTIAL_HASH_SIZE bytes)
+        partial_groups: Dict[tuple, List[str]] = defaultdict(list)
+        to_partial = [
+            (file_path, size)
+            for size, files in candidates_by_size.items()
+            for file_path in files
+        ]
+        partial_hashes = map_in_pool(
+            lambda job: self._partial_hash_or_none(*job),
+            to_partial,
+            len(to_partial) if sequential else PARTIAL_HASH_BATCH_SIZE,
+        )
+        for (file_path, size), partial_hash in zip(to_partial, partial_hashes):
+            if partial_hash is not None:
+                # Key includes size to avoid collision between varying sizes with same partial content
+                partial_groups[(size, partial_hash)].append(file_path)
 
-        for size, files in candidates_by_size.items():
-            for file_path in files:
-                try:
-                    # Use 64KB for partial hash
-                    partial_hash = self._compute_partial_hash(file_path, chunk_size=65536, file_size=size)
-                    # Key needs to include size to avoid collision between varying sizes with same partial content (rare but possible)
-                    key = f"{size}:{partial_hash}"
-                    if key not in partial_groups:
-                        partial_groups[key] = []
-                    partial_groups[key].append(file_path)
-                except OSError as e:
-                    logger.debug(f"Failed to compute partial hash for {file_path}: {e}")
-                    continue
+        # Pass 3: Full Hash
+        duplicates: Dict[str, List[str]] = defaultdict(list)
+        to_hash: List[tuple] = []
 
-        candidates_by_partial = [files for files in partial_groups.values() if len(files) > 1]
+        for (size, partial_hash), group in partial_groups.items():
+            if len(group) < 2:
+                continue
+            if size <= 2 * PARTIAL_HASH_SIZE:
+                # The partial hash already covered the whole file
+                duplicates[partial_hash].extend(group)
+                continue
+            to_hash.extend((file_path, size) for file_path in group)
 
-        # Pass 3: Full Hash (SHA-256)
-        duplicates: Dict[str, List[Path]] = {}
-        
-        for group in candidates_by_partial:
-            for file_path in group:
-                try:
-                    file_hash = self._compute_file_hash(file_path)
-                    if file_hash not in duplicates:
-                        duplicates[file_hash] = []
-                    duplicates[file_hash].append(file_path)
-                except OSError as e:
-                    logger.debug(f"Failed to compute full hash for {file_path}: {e}")
-                    continue
+        hashes = map_in_pool(
+            lambda job: self._full_hash_or_none(*job),
+            to_hash,
+            len(to_hash) if sequential else 1,
+        )
+        for (file_path, _), file_hash in zip(to_hash, hashes):
+            if file_hash is not None:
+                duplicates[file_hash].append(file_path)
 
         # Final filtering
         result = {
-            hash_val: paths for hash_val, paths in duplicates.items()
+            hash_val: [Path(p) for p in paths]
+            for hash_val, paths in duplicates.items()
             if len(paths) > 1
         }
         
         return result
 
+    def _partial_hash_or_none(self, file_path: str, size: int) -> Optional[str]:
+        """Partial hash for the duplicate pass, or None if unreadable."""
+        try:
+            return self._compute_partial_hash(
+                file_path, chunk_size=PARTIAL_HASH_SIZE, file_size=size
+            )
+        except OSError as e:
+            logger.debug(f"Failed to compute partial hash for {file_path}: {e}")
+            return None
+
+    def _full_hash_or_none(self, file_path: str, size: int) -> Optional[str]:
+        """Full-content hash for the duplicate pass, or None if unreadable."""
+        try:
+            return self._compute_file_hash(file_path, file_size=size)
+        except OSError as e:
+            logger.debug(f"Failed to compute full hash for {file_path}: {e}")
+            return None
+
     async def resolve_duplicates(
         self,
         duplicates: Dict[str, List[Path]],
@@ -295,50 +459,43 @@ class FileOrganizer:
         Resolve duplicates based on strategy.
         Returns list of deleted files.
         """
-        deleted_files = []
+        if strategy == ConflictResolutionStrategy.INTERACTIVE:
+            # Interactive resolution is handled by the caller (CLI/UI),
+            # which passes the files it chose for deletion elsewhere.
+            return []
+
+        pick, attr = self._KEEP_RULES[strategy]
+        to_delete: List[Path] = []
 
-        for hash_val, paths in duplicates.items():
+        for paths in duplicates.values():
             if len(paths) < 2:
                 continue
 
-            sorted_paths = list(paths)
+            # One stat per file; the keeper is the first path with the
+            # extreme value, matching a stable sort on the same key.
             try:
-                # Determine which file to KEEP (index 0)
-                if strategy == ConflictResolutionStrategy.KEEP_NEWEST:
-                    # Sort descending by mtime (newest first)
-                    sorted_paths.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                elif strategy == ConflictResolutionStrategy.KEEP_OLDEST:
-                    # Sort ascending by mtime (oldest first)
-                    sorted_paths.sort(key=lambda p: p.stat().st_mtime)
-                elif strategy == ConflictResolutionStrategy.KEEP_LARGEST:
-                    # Sort descending by size (largest first - theoretically duplicates have same size, but good for robustness)
-                    sorted_paths.sort(key=lambda p: p.stat().st_size, reverse=True)
-                elif strategy == ConflictResolutionStrategy.KEEP_SMALLEST:
-                    # Sort ascending by size
-                    sorted_paths.sort(key=lambda p: p.stat().st_size)
-                elif strategy == ConflictResolutionStrategy.INTERACTIVE:
-                    # Interactive resolution is handled by caller (CLI/UI), they pass specific list to delete?
-                    # Or maybe this method just returns candidates if interactive?
-                    # For now, let's assume interactive means we skip auto-deletion here.
-                    continue
+                values = [getattr(p.stat(), attr) for p in paths]
             except OSError:
                 continue
+            keep = pick(range(len(paths)), key=values.__getitem__)
+            to_delete.extend(p for i, p in enumerate(paths) if i != keep)
 
-            # Keep first (index 0), delete rest (index 1:)
-            to_delete = sorted_paths[1:]
-
-            for p in to_delete:
-                try:
-                    await self.file_ops.delete(p)
-                    deleted_files.append(p)
-                    if progress_queue:
-                        await progress_queue.put(p)
-                except Exception as e:
-                    logger.warning(f"Failed to delete duplicate {p}: {e}")
-
-        return deleted_files
+        return await self._delete_many(
+            to_delete, progress_queue, max_concurrent=MAX_CONCURRENT_DUPLICATE_DELETES
+        )
 
     
+    @staticmethod
+    def _iter_entries(directory: Path, recursive: bool) -> Iterator[os.DirEntry]:
+        """
+        Iterate over directory entries, optionally recursively.
+        """
+        if recursive:
+            yield from recursive_scan(directory)
+        else:
+            with os.scandir(directory) as it:
+                yield from it
+
     def _iter_files(self, directory: Path, recursive: bool) -> Iterator[Path]:
         """
         Iterate over files in a directory, optionally recursively.
@@ -399,11 +556,26 @@ class FileOrganizer:
         return renamed_files
     
     @staticmethod
-    def _get_unique_path(target_path: Path) -> Path:
+    def _list_names(directory: Path) -> Set[str]:
+        """Names present in directory; empty if it cannot be listed."""
+        try:
+            return set(os.listdir(directory))
+        except OSError:
+            return set()
+
+    @staticmethod
+    def _get_unique_path(target_path: Path, taken: Optional[Set[str]] = None) -> Path:
         """
         Generate a unique path by appending a counter if target exists.
+        If taken is given, it is the set of names already in the target's
+        directory and is checked instead of the filesystem.
         """
-        if not target_path.exists():
+        def is_taken(path: Path) -> bool:
+            if taken is None:
+                return path.exists()
+            return path.name in taken
+
+        if not is_taken(target_path):
             return target_path
 
         stem = target_path.stem
@@ -414,12 +586,12 @@ class FileOrganizer:
         while True:
             new_name = f"{stem}_{counter}{suffix}"
             new_path = parent / new_name
-            if not new_path.exists():
+            if not is_taken(new_path):
                 return new_path
             counter += 1
 
     @staticmethod
-    def _build_extension_map(categories: Dict[str, List[str]]) -> Dict[str, str]:
+    def _build_extension_map(categories: Mapping[str, Sequence[str]]) -> Dict[str, str]:
         """
         Build an inverted mapping from extensions to categories.
         """
@@ -430,56 +602,78 @@ class FileOrganizer:
         return extension_map
 
     @staticmethod
-    def _get_file_category(
-        file_path: Path,
-        extension_map: Dict[str, str]
-    ) -> Optional[str]:
-        """
-        Determine the category of a file based on its extension.
-        """
-        extension = file_path.suffix.lower()
-        return extension_map.get(extension)
-    
-    @staticmethod
-    def _compute_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
+    def _compute_file_hash(
+        file_path: Union[str, Path],
+        chunk_size: int = FULL_HASH_CHUNK_SIZE,
+        file_size: Optional[int] = None
+    ) -> str:
         """
-        Compute SHA256 hash of a file.
+        Compute the BLAKE3 (or BLAKE2b fallback) hash of a file.
         """
-        sha256_hash = hashlib.sha256()
-        
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(chunk_size), b""):
-                sha256_hash.update(chunk)
-        
-        return sha256_hash.hexdigest()
+        if file_size is None:
+            file_size = os.stat(file_path).st_size
+
+        if _blake3 is not None and file_size >= BLAKE3_MMAP_THRESHOLD:
+            big_hasher = _blake3(max_threads=_blake3.AUTO)
+            big_hasher.update_mmap(file_path)
+            return big_hasher.hexdigest()
+
+        hasher = _new_hasher()
+
+        with open(file_path, "rb", buffering=0) as f:
+            fd = f.fileno()
+            _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+            if os.fstat(fd).st_size >= MMAP_HASH_THRESHOLD:
+                # Feed the mapping in large slices: few update() calls, each
+                # running without the GIL over data the kernel pages in.
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view:
+                        for offset in range(0, len(view), MMAP_HASH_SLICE):
+                            hasher.update(view[offset:offset + MMAP_HASH_SLICE])
+            else:
+                # Read into this thread's reusable buffer, sized so a small
+                # file takes one read; unbuffered so data is copied only once
+                buf = _read_buffer(max(1, min(chunk_size, file_size + 1)))
+                while n := f.readinto(buf):
+                    hasher.update(buf[:n])
+            # Hashed content won't be read again; don't let it evict hot pages
+            _fadvise(fd, "POSIX_FADV_DONTNEED")
+
+        return hasher.hexdigest()
 
     @staticmethod
     def _compute_partial_hash(
-        file_path: Path,
-        chunk_size: int = 65536,
+        file_path: Union[str, Path],
+        chunk_size: int = PARTIAL_HASH_SIZE,
         file_size: Optional[int] = None
     ) -> str:
         """
         Compute a partial hash of a file using start and end chunks.
         """
         if file_size is None:
-            try:
-                file_size = file_path.stat().st_size
-            except OSError:
-                raise
+            file_size = os.stat(file_path).st_size
 
         # If file is small, hash the whole thing
         if file_size <= 2 * chunk_size:
-            return FileOrganizer._compute_file_hash(file_path, chunk_size)
+            return FileOrganizer._compute_file_hash(file_path, chunk_size, file_size)
 
-        sha256_hash = hashlib.sha256()
+        hasher = _new_hasher()
+
+        with open(file_path, "rb", buffering=0) as f:
+            fd = f.fileno()
+            tail_offset = file_size - chunk_size
+            # Ask for the tail up front so both reads are in flight together
+            _fadvise(fd, "POSIX_FADV_WILLNEED", tail_offset, chunk_size)
 
-        with open(file_path, "rb") as f:
             # Start
-            sha256_hash.update(f.read(chunk_size))
+            hasher.update(os.pread(fd, chunk_size, 0))
 
             # End
-            f.seek(-chunk_size, os.SEEK_END)
-            sha256_hash.update(f.read(chunk_size))
+            hasher.update(os.pread(fd, chunk_size, tail_offset))
+
+            # Most files stop here as singletons; don't keep their pages cached
+            _fadvise(fd, "POSIX_FADV_DONTNEED")
 
-        return sha256_hash.hexdigest()
+        return hasher.hexdigest()
@@ -93,6 +93,7 @@ def setup_parser():
     organize.add_argument('--by-type', action='store_true', help='Organize by file type')
     organize.add_argument('--by-date', action='store_true', help='Organize by date')
     organize.add_argument('--move', action='store_true', help='Move files instead of copy')
+    organize.set_defaults(handler=handle_organize)
     
     # Search command
     search = subparsers.add_parser('search', help='Search for files')
@@ -100,12 +101,14 @@ def setup_parser():
     search.add_argument('--name', help='File name pattern')
     search.add_argument('--content', help='Search file contents')
     search.add_argument('--case-sensitive', action='store_true', help='Case sensitive search')
+    search.set_defaults(handler=handle_search)
     
     # Duplicates command
     dup = subparsers.add_parser('duplicates', help='Find duplicate files')
     dup.add_argument('--dir', required=True, help='Directory to search')
     dup.add_argument('--recursive', action='store_true', default=True, help='Search recursively')
     dup.add_argument('--resolve', choices=['newest', 'oldest', 'largest', 'smallest', 'interactive'], help='Resolve duplicates strategy')
+    dup.set_defaults(handler=handle_duplicates)
     
     # Cleanup command
     cleanup = subparsers.add_parser('cleanup', help='Clean up old files')
@@ -113,6 +116,7 @@ def setup_parser():
     cleanup.add_argument('--days', type=int, required=True, help='Delete files older than N days')
     cleanup.add_argument('--dry-run', action='store_true', help='Show what would be deleted without deleting')
     cleanup.add_argument('--recursive', action='store_true', help='Search recursively')
+    cleanup.set_defaults(handler=handle_cleanup)
     
     # Rename command
     rename = subparsers.add_parser('rename', help='Batch rename files')
@@ -120,11 +124,13 @@ def setup_parser():
     rename.add_argument('--pattern', required=True, help='Text pattern to match')
     rename.add_argument('--replacement', required=True, help='Replacement text')
     rename.add_argument('--recursive', action='store_true', help='Process subdirectories')
+    rename.set_defaults(handler=handle_rename)
 
     # Config command
     config = subparsers.add_parser('config', help='Manage configuration')
     config.add_argument('--edit', action='store_true', help='Edit configuration file')
     config.add_argument('--theme', choices=['dark', 'light', 'solarized', 'dracula'], help='Set UI theme')
+    config.set_defaults(handler=handle_config)
 
     # Tags command
     tags = subparsers.add_parser('tags', help='Manage file tags')
@@ -134,6 +140,7 @@ def setup_parser():
     tags.add_argument('--search', metavar='TAG', help='List files with tag')
     tags.add_argument('--cleanup', action='store_true', help='Clean up missing files')
     tags.add_argument('--export', action='store_true', help='Export all tags')
+    tags.set_defaults(handler=handle_tags)
 
     # Schedule command
     schedule = subparsers.add_parser('schedule', help='Manage scheduled tasks')
@@ -142,6 +149,7 @@ def setup_parser():
     schedule.add_argument('--remove', metavar='NAME', help='Remove job')
     schedule.add_argument('--daemon', action='store_true', help='Run scheduler daemon')
     schedule.add_argument('--run-now', metavar='NAME', help='Run a scheduled job immediately')
+    schedule.set_defaults(handler=handle_schedule)
     
     return parser
 
@@ -549,18 +557,8 @@ async def main_async():
         parser.print_help()
         return 1
     
-    command_handlers = {
-        'organize': handle_organize,
-        'search': handle_search,
-        'duplicates': handle_duplicates,
-        'cleanup': handle_cleanup,
-        'rename': handle_rename,
-        'config': handle_config,
-        'tags': handle_tags,
-        'schedule': handle_schedule
-    }
-
-    handler = command_handlers.get(args.command)
+    # Each subparser sets its handler via set_defaults
+    handler = getattr(args, 'handler', None)
     if handler:
         try:
             return await handler(args)
@@ -6,24 +6,36 @@ try:
 except ImportError:
     raise ImportError("PyYAML is required for configuration management. Please install it with `pip install PyYAML`.")
 
+try:
+    # LibYAML-backed C implementations, available in most PyYAML builds
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper  # type: ignore[assignment]
+
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Sequence, Tuple
 from .logger import get_logger
 
 logger = get_logger("config")
 
-DEFAULT_CATEGORIES = {
-    'images': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico'],
-    'videos': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'],
-    'audio': ['.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'],
-    'documents': ['.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt'],
-    'spreadsheets': ['.xls', '.xlsx', '.csv', '.ods'],
-    'presentations': ['.ppt', '.pptx', '.odp'],
-    'archives': ['.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'],
-    'code': ['.py', '.js', '.java', '.c', '.cpp', '.h', '.html', '.css', '.sh'],
-    'data': ['.json', '.xml', '.yaml', '.yml', '.sql', '.db'],
-}
+# Read-only; load_categories hands out list copies via _default_categories()
+DEFAULT_CATEGORIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'images': ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico'),
+    'videos': ('.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'),
+    'audio': ('.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a', '.wma'),
+    'documents': ('.pdf', '.doc', '.docx', '.txt', '.rtf', '.odt'),
+    'spreadsheets': ('.xls', '.xlsx', '.csv', '.ods'),
+    'presentations': ('.ppt', '.pptx', '.odp'),
+    'archives': ('.zip', '.rar', '.7z', '.tar', '.gz', '.bz2'),
+    'code': ('.py', '.js', '.java', '.c', '.cpp', '.h', '.html', '.css', '.sh'),
+    'data': ('.json', '.xml', '.yaml', '.yml', '.sql', '.db'),
+})
+
+def _default_categories() -> Dict[str, List[str]]:
+    """A fresh, mutable copy of DEFAULT_CATEGORIES."""
+    return {cat: list(exts) for cat, exts in DEFAULT_CATEGORIES.items()}
 
 DEFAULT_CONFIG = {
     'theme': 'dark',
@@ -39,6 +51,9 @@ class ConfigManager:
         self.categories_file = self.config_dir / "categories.yaml"
         self.config_file = self.config_dir / "config.yaml"
         self.recent_file = self.config_dir / "recent.json"
+        # (st_mtime_ns, st_size) of categories_file and the merged result
+        # The cached result holds tuples; callers always get fresh lists.
+        self._categories_cache: Optional[Tuple[Tuple[int, int], Dict[str, Tuple[str, ...]]]] = None
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -54,39 +69,50 @@ class ConfigManager:
         Load file categories from configuration file.
         Falls back to defaults if file doesn't exist or is invalid.
         """
-        if not self.categories_file.exists():
+        try:
+            st = self.categories_file.stat()
+        except OSError:
             # Create default file if it doesn't exist so user can edit it
             self.save_categories(DEFAULT_CATEGORIES)
-            return DEFAULT_CATEGORIES
+            return _default_categories()
+
+        signature = (st.st_mtime_ns, st.st_size)
+        if self._categories_cache is not None and self._categories_cache[0] == signature:
+            return {cat: list(exts) for cat, exts in self._categories_cache[1].items()}
 
         try:
             with open(self.categories_file, 'r') as f:
-                categories = yaml.safe_load(f)
+                categories = yaml.load(f, Loader=SafeLoader)
 
             if not isinstance(categories, dict):
                 logger.warning("Invalid categories config format. Using defaults.")
-                return DEFAULT_CATEGORIES.copy()
+                return _default_categories()
 
             # Merge with defaults
-            merged = DEFAULT_CATEGORIES.copy()
+            merged = _default_categories()
             for cat, exts in categories.items():
                 if isinstance(exts, list):
                     if cat in merged:
-                        merged[cat] = list(set(merged[cat] + exts))
+                        merged[cat] = list(set(merged[cat]).union(exts))
                     else:
                         merged[cat] = exts
+            self._categories_cache = (
+                signature, {cat: tuple(exts) for cat, exts in merged.items()}
+            )
             return merged
 
         except (yaml.YAMLError, OSError) as e:
             logger.error(f"Error loading categories config: {e}")
-            return DEFAULT_CATEGORIES.copy()
+            return _default_categories()
 
-    def save_categories(self, categories: Dict[str, List[str]]) -> None:
+    def save_categories(self, categories: Mapping[str, Sequence[str]]) -> None:
         """Save categories to configuration file."""
+        # Plain dict of lists so the YAML stays editable
+        plain = {cat: list(exts) for cat, exts in categories.items()}
         try:
             self._ensure_config_dir()
             with open(self.categories_file, 'w') as f:
-                yaml.dump(categories, f, default_flow_style=False)
+                yaml.dump(plain, f, Dumper=SafeDumper, default_flow_style=False)
         except OSError as e:
             logger.error(f"Error saving categories config: {e}")
 
@@ -98,7 +124,7 @@ class ConfigManager:
 
         try:
             with open(self.config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
 
             if not isinstance(config, dict):
                 return DEFAULT_CONFIG
@@ -116,7 +142,7 @@ class ConfigManager:
         try:
             self._ensure_config_dir()
             with open(self.config_file, 'w') as f:
-                yaml.dump(config, f, default_flow_style=False)
+                yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False)
         except OSError as e:
             logger.error(f"Error saving config: {e}")
 
@@ -2,22 +2,139 @@
 Core file operations with undo/redo support.
 """
 
+import os
+import sys
+import json
+import errno
+import ctypes
 import shutil
 import uuid
 import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum, auto
 from pathlib import Path
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional
 from dataclasses import dataclass, field
 
-from .utils import recursive_scan
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None  # type: ignore[assignment]
+
 from .logger import get_logger
 from .exceptions import TFMPermissionError, TFMPathNotFoundError, TFMOperationConflictError
 from .plugins.registry import PluginRegistry
 
 logger = get_logger("file_ops")
 
+# Directories with more top-level entries than this have their subtrees
+# sized in parallel; smaller ones are not worth the thread pool overhead.
+PARALLEL_SIZE_THRESHOLD = 256
+
+
+# Operations kept on the undo stack; the oldest drop off first
+MAX_UNDO_HISTORY = 100
+
+# Bytes requested per copy_file_range call
+COPY_CHUNK_SIZE = 1 << 30
+
+
+# renameat2(2) flag: fail with EEXIST instead of replacing the target
+RENAME_NOREPLACE = 1
+AT_FDCWD = -100
+
+
+def _load_renameat2():
+    """glibc's renameat2, or None where it isn't available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        return getattr(ctypes.CDLL(None, use_errno=True), "renameat2", None)
+    except OSError:
+        return None
+
+
+_renameat2 = _load_renameat2()
+
+
+def _rename_noreplace(source: str, target: str) -> None:
+    """
+    Rename source to target, raising FileExistsError if target exists.
+    On Linux the check and the rename are one atomic renameat2 call;
+    elsewhere, or on filesystems without RENAME_NOREPLACE, it falls back
+    to checking first.
+    """
+    if _renameat2 is not None:
+        if _renameat2(AT_FDCWD, os.fsencode(source), AT_FDCWD, os.fsencode(target),
+                      RENAME_NOREPLACE) == 0:
+            return
+        err = ctypes.get_errno()
+        if err not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(err, os.strerror(err), source, None, target)
+    if os.path.lexists(target):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), target)
+    os.rename(source, target)
+
+
+def _dumps_size_cache(cache: Dict[str, list]) -> bytes:
+    """Serialise the size cache, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(cache)
+    return json.dumps(cache).encode()
+
+
+def _copy_file(source: str, target: str) -> str:
+    """
+    shutil.copy2 equivalent that lets the kernel move the data.
+    Uses copy_file_range where available, which reflinks on CoW filesystems.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return shutil.copy2(source, target)
+    try:
+        with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+            in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+            copied = 0
+            while n := os.copy_file_range(in_fd, out_fd, COPY_CHUNK_SIZE):
+                copied += n
+    except OSError:
+        # EXDEV, ENOSYS or EINVAL on older kernels and some filesystems
+        return shutil.copy2(source, target)
+    if copied == 0:
+        # procfs/sysfs, some FUSE and overlay mounts and some cross-filesystem
+        # kernels report 0 straight away instead of failing; copying
+        # genuinely empty files through copy2 as well costs nothing.
+        return shutil.copy2(source, target)
+    shutil.copystat(source, target)
+    return target
+
+
+def _scan_tree_size(directory: str) -> int:
+    """
+    Sum the sizes of all files below directory.
+    Same traversal as recursive_scan, inlined so the accumulation runs in
+    one frame instead of resuming a generator for every entry.
+    """
+    total = 0
+    stack = [directory]
+    pop, push = stack.pop, stack.append
+    while stack:
+        try:
+            with os.scandir(pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            push(entry.path)
+                        elif entry.is_file(follow_symlinks=True):
+                            total += entry.stat().st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
+
+
 class OperationType(Enum):
     MOVE = auto()
     COPY = auto()
@@ -59,15 +176,19 @@ class OperationHistory:
     """Tracks destructive operations and supports undo/redo."""
 
     def __init__(self):
-        self._undo_stack: List[FileOperation] = []
+        # Bounded deque: dropping the oldest entry is O(1), unlike list.pop(0)
+        self._undo_stack: Deque[FileOperation] = deque(maxlen=MAX_UNDO_HISTORY)
         self._redo_stack: List[FileOperation] = []
 
     def log_operation(self, op: FileOperation) -> None:
         """Log an operation to the undo stack."""
         self._undo_stack.append(op)
         self._redo_stack.clear()
-        if len(self._undo_stack) > 100:
-            self._undo_stack.pop(0)
+
+    def clear(self) -> None:
+        """Drop all undo and redo entries."""
+        self._undo_stack.clear()
+        self._redo_stack.clear()
 
     def undo_last(self) -> Optional[FileOperation]:
         """Get the last operation to undo."""
@@ -87,11 +208,19 @@ class OperationHistory:
 
 class FileOperations:
     """Handles core file operations with undo support."""
-    def __init__(self, history: Optional[OperationHistory] = None):
+    def __init__(
+        self,
+        history: Optional[OperationHistory] = None,
+        cache_path: Optional[Path] = None
+    ):
         self.history = history or OperationHistory()
         self.trash_dir = Path.home() / ".tfm" / "trash"
         self._ensure_trash_dir()
         self.plugins = PluginRegistry()
+        # Opt-in on-disk cache for get_size, keyed by directory path.
+        # It is only written by an explicit save_size_cache() call.
+        self.cache_path = cache_path
+        self._size_cache: Optional[Dict[str, list]] = None
 
     def _ensure_trash_dir(self):
         """Ensure trash directory exists."""
@@ -123,9 +252,11 @@ class FileOperations:
         try:
 
             if source.is_dir():
-                await asyncio.to_thread(shutil.copytree, str(source), str(target))
+                await asyncio.to_thread(
+                    shutil.copytree, str(source), str(target), copy_function=_copy_file
+                )
             else:
-                await asyncio.to_thread(shutil.copy2, str(source), str(target))
+                await asyncio.to_thread(_copy_file, str(source), str(target))
             self.history.log_operation(FileOperation(OperationType.COPY, source, target))
             self.plugins.on_file_added(target)
             return True
@@ -156,14 +287,12 @@ class FileOperations:
         if not path.exists():
              raise TFMPathNotFoundError(str(path))
         target = path.parent / new_name
-        if target.exists():
-             raise TFMOperationConflictError(f"Target already exists: {target}")
         try:
-            await asyncio.to_thread(path.rename, target)
+            await asyncio.to_thread(_rename_noreplace, str(path), str(target))
             self.history.log_operation(FileOperation(OperationType.RENAME, path, target))
             return True
-        except (TFMPathNotFoundError, TFMOperationConflictError):
-            raise
+        except FileExistsError:
+            raise TFMOperationConflictError(f"Target already exists: {target}")
         except Exception as e:
             logger.error(f"Rename failed: {e}")
             return False
@@ -186,7 +315,7 @@ class FileOperations:
             return False
 
     def get_size(self, path: Path) -> int:
-        """Return size in bytes. For directories, recurse via recursive_scan."""
+        """Return size in bytes. For directories, sum all files beneath it."""
         if not path.exists():
             return 0
         if path.is_file():
@@ -194,15 +323,117 @@ class FileOperations:
                 return path.stat().st_size
             except OSError:
                 return 0
+        if self.cache_path is not None:
+            return self._get_cached_directory_size(path)
+        return self._get_directory_size(path)
+
+    def _get_directory_size(self, path: Path) -> int:
+        """
+        Sum file sizes below a directory.
+        Wide directories have their subdirectories scanned on a thread pool.
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return 0
+
         total = 0
-        for entry in recursive_scan(path):
-            if entry.is_file(follow_symlinks=True):
-                try:
+        subdirs: List[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=True):
                     total += entry.stat().st_size
-                except OSError:
-                    pass
+            except OSError:
+                pass
+
+        if len(entries) > PARALLEL_SIZE_THRESHOLD and len(subdirs) > 1:
+            workers = min(len(subdirs), (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                total += sum(pool.map(_scan_tree_size, subdirs))
+        else:
+            total += sum(_scan_tree_size(d) for d in subdirs)
         return total
 
+    def _get_cached_directory_size(self, path: Path) -> int:
+        """
+        Sum file sizes below a directory, reusing cached per-directory totals.
+
+        Each directory's entry records its (st_dev, st_ino, st_mtime_ns), the
+        combined size of the files directly inside it and its subdirectories.
+        When the stat still matches, the directory is not listed again and
+        the walk continues into the remembered subdirectories. A directory's
+        mtime only changes when entries are added, removed or renamed, so a
+        file rewritten in place keeps its old cached size.
+        """
+        cache = self._load_size_cache()
+        total = 0
+        stack = [str(path)]
+        while stack:
+            current = stack.pop()
+            try:
+                st = os.stat(current)
+            except OSError:
+                cache.pop(current, None)
+                continue
+
+            signature = [st.st_dev, st.st_ino, st.st_mtime_ns]
+            cached = cache.get(current)
+            if cached is not None and cached[:3] == signature:
+                total += cached[3]
+                stack.extend(cached[4])
+                continue
+
+            own_size = 0
+            subdirs: List[str] = []
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=True):
+                                own_size += entry.stat().st_size
+                        except OSError:
+                            pass
+            except OSError:
+                continue
+
+            cache[current] = signature + [own_size, subdirs]
+            total += own_size
+            stack.extend(subdirs)
+        return total
+
+    def _load_size_cache(self) -> Dict[str, list]:
+        """Load the size cache from disk on first use."""
+        if self._size_cache is None:
+            self._size_cache = {}
+            if self.cache_path is not None and self.cache_path.exists():
+                try:
+                    # orjson.JSONDecodeError is a ValueError like json's
+                    loads = orjson.loads if orjson is not None else json.loads
+                    self._size_cache = loads(self.cache_path.read_bytes())
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ignoring unreadable size cache {self.cache_path}: {e}")
+        return self._size_cache
+
+    def save_size_cache(self) -> None:
+        """
+        Write the size cache to cache_path, dropping entries for directories
+        that no longer exist. The parent directory is not created.
+        """
+        if self.cache_path is None or self._size_cache is None:
+            return
+        cache = self._size_cache
+        for gone in [d for d in cache if not os.path.isdir(d)]:
+            del cache[gone]
+        try:
+            self.cache_path.write_bytes(_dumps_size_cache(cache))
+        except OSError as e:
+            logger.warning(f"Failed to save size cache {self.cache_path}: {e}")
+
     @staticmethod
     def format_size(size: int) -> str:
         """Convert bytes to a human-readable string."""
@@ -260,9 +491,12 @@ class FileOperations:
                 return f"Redid move: {op.original_path.name}"
             elif op.type == OperationType.COPY and op.target_path:
                 if op.original_path.is_dir():
-                    await asyncio.to_thread(shutil.copytree, str(op.original_path), str(op.target_path))
+                    await asyncio.to_thread(
+                        shutil.copytree, str(op.original_path), str(op.target_path),
+                        copy_function=_copy_file
+                    )
                 else:
-                    await asyncio.to_thread(shutil.copy2, str(op.original_path), str(op.target_path))
+                    await asyncio.to_thread(_copy_file, str(op.original_path), str(op.target_path))
                 return f"Redid copy: {op.original_path.name}"
             elif op.type == OperationType.DELETE and op.trash_path:
                 await asyncio.to_thread(shutil.move, str(op.original_path), str(op.trash_path))
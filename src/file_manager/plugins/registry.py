@@ -4,7 +4,7 @@ Plugin registry for TFM.
 import sys
 import importlib.util
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple, Type
 from .base import TFMPlugin
 from ..logger import get_logger
 
@@ -16,12 +16,17 @@ class PluginRegistry:
     _instance: Optional['PluginRegistry'] = None
     plugins: List[TFMPlugin]
     plugin_dir: Path
+    # Plugin file path -> (st_mtime_ns, st_size, plugin classes it defines)
+    _loaded: Dict[str, Tuple[int, int, List[Type[TFMPlugin]]]]
+    _plugins_loaded: bool
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(PluginRegistry, cls).__new__(cls)
             cls._instance.plugins = []
             cls._instance.plugin_dir = Path.home() / ".tfm" / "plugins"
+            cls._instance._loaded = {}
+            cls._instance._plugins_loaded = False
         return cls._instance
 
     def register(self, plugin: TFMPlugin) -> None:
@@ -29,8 +34,14 @@ class PluginRegistry:
         self.plugins.append(plugin)
         logger.info(f"Registered plugin: {plugin.name}")
 
+    def ensure_loaded(self) -> None:
+        """Load plugins the first time they are needed; later calls are no-ops."""
+        if not self._plugins_loaded:
+            self.load_plugins()
+
     def load_plugins(self) -> None:
         """Load plugins from the plugin directory."""
+        self._plugins_loaded = True
         self.plugins.clear()
         if not self.plugin_dir.exists():
             try:
@@ -43,22 +54,43 @@ class PluginRegistry:
                 continue
 
             try:
-                spec = importlib.util.spec_from_file_location(plugin_file.stem, plugin_file)
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    sys.modules[spec.name] = module
-                    spec.loader.exec_module(module)
-
-                    # Find and register TFMPlugin subclasses
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (isinstance(attr, type) and
-                            issubclass(attr, TFMPlugin) and
-                            attr is not TFMPlugin):
-                            self.register(attr())
+                # Files unchanged since they were last executed reuse the
+                # classes found then instead of being imported again.
+                st = plugin_file.stat()
+                key = str(plugin_file)
+                cached = self._loaded.get(key)
+                if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                    plugin_classes = cached[2]
+                else:
+                    plugin_classes = self._import_plugin_classes(plugin_file)
+                    self._loaded[key] = (st.st_mtime_ns, st.st_size, plugin_classes)
+
+                for plugin_cls in plugin_classes:
+                    self.register(plugin_cls())
             except Exception as e:
                 logger.error(f"Failed to load plugin {plugin_file}: {e}")
 
+    @staticmethod
+    def _import_plugin_classes(plugin_file: Path) -> List[Type[TFMPlugin]]:
+        """Execute a plugin file and return the TFMPlugin subclasses it defines."""
+        spec = importlib.util.spec_from_file_location(plugin_file.stem, plugin_file)
+        if not spec or not spec.loader:
+            return []
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+
+        # Find TFMPlugin subclasses
+        classes = []
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if (isinstance(attr, type) and
+                issubclass(attr, TFMPlugin) and
+                attr is not TFMPlugin):
+                classes.append(attr)
+        return classes
+
     # Hooks
     def on_file_added(self, path: Path) -> None:
         for plugin in self.plugins:
@@ -2,19 +2,41 @@
 Task Scheduler for File Manager Automation.
 """
 
+import os
 import json
 import time
+import heapq
 import logging
 import asyncio
+import itertools
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime
-from croniter import croniter
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+from datetime import datetime, timedelta
 
 from .automation import FileOrganizer
 
+if TYPE_CHECKING:
+    from croniter import croniter
+
 logger = logging.getLogger(__name__)
 
+# A job that has never run only fires for a scheduled time this recent
+FIRST_RUN_WINDOW = timedelta(seconds=60)
+# Most jobs run_pending will have executing at the same time
+MAX_PARALLEL_JOBS = 8
+
+
+@lru_cache(maxsize=256)
+def _cron_iter(cron_expr: str) -> "croniter":
+    """
+    Parsed croniter for an expression, shared by every job that uses it.
+    Parsing dominates croniter's cost, so callers reposition the cached
+    iterator with set_current() instead of building a new one.
+    """
+    from croniter import croniter
+    return croniter(cron_expr)
+
 class TaskScheduler:
     """
     Manages scheduled automation tasks.
@@ -36,6 +58,12 @@ class TaskScheduler:
 
         self.organizer = FileOrganizer()
         self.jobs: List[Dict[str, Any]] = []
+        # Min-heap of (due timestamp, sequence, job name). Entries are never
+        # removed in place; _scheduled maps each name to the (schedule key,
+        # sequence) of its live entry, and anything else is skipped on pop.
+        self._heap: List[Tuple[float, int, str]] = []
+        self._scheduled: Dict[str, Tuple[tuple, int]] = {}
+        self._seq = itertools.count()
         self._load_jobs()
 
     def _load_jobs(self):
@@ -50,16 +78,32 @@ class TaskScheduler:
         else:
             self.jobs = []
 
-    def _save_jobs(self):
-        """Save jobs to JSON file."""
+    def _save_jobs(self, durable: bool = True):
+        """
+        Save jobs to JSON file.
+        Writes a sibling temp file and renames it over the schedule, so a
+        crash mid-write never leaves a truncated file. durable=False skips
+        the fsync; used for last_run bumps, which are cheap to lose.
+        """
+        tmp_file = self.schedule_file.with_name(self.schedule_file.name + ".tmp")
         try:
-            with open(self.schedule_file, "w") as f:
+            with open(tmp_file, "w") as f:
                 json.dump(self.jobs, f, indent=2)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.schedule_file)
         except OSError as e:
             logger.error(f"Failed to save schedule: {e}")
+            try:
+                tmp_file.unlink(missing_ok=True)
+            except OSError:
+                pass
 
     def add_job(self, name: str, cron_expr: str, task_type: str, params: Dict[str, Any]) -> bool:
         """Add a new scheduled job."""
+        # croniter takes ~50ms to import; only pay for it once a cron is used
+        from croniter import croniter
         if not croniter.is_valid(cron_expr):
             logger.error(f"Invalid cron expression: {cron_expr}")
             return False
@@ -98,36 +142,91 @@ class TaskScheduler:
         """List all jobs."""
         return self.jobs
 
+    @staticmethod
+    def _schedule_key(job: Dict[str, Any]) -> tuple:
+        """The fields that decide when a job is next due."""
+        return (job["cron"], job.get("last_run"), job.get("enabled", True))
+
+    @staticmethod
+    def _due_time(job: Dict[str, Any], now: datetime) -> float:
+        """Timestamp of the first scheduled time the job has not yet run for."""
+        last_run = job.get("last_run")
+        if last_run is None:
+            base = now - FIRST_RUN_WINDOW
+        else:
+            base = datetime.fromtimestamp(last_run)
+        cron = _cron_iter(job["cron"])
+        cron.set_current(base, force=True)
+        return cron.get_next(datetime).timestamp()
+
+    def _queue_job(self, job: Dict[str, Any], now: datetime) -> None:
+        """Push a fresh heap entry for a job, superseding any older one."""
+        key = self._schedule_key(job)
+        seq = next(self._seq)
+        self._scheduled[job["name"]] = (key, seq)
+        if not job.get("enabled", True):
+            return
+        try:
+            due = self._due_time(job, now)
+        except Exception as e:
+            logger.error(f"Error checking job {job['name']}: {e}")
+            return
+        heapq.heappush(self._heap, (due, seq, job["name"]))
+
     async def run_pending(self):
         """Check and run pending jobs."""
         now = datetime.now()
+        now_ts = now.timestamp()
+
+        # Only jobs that are new or whose cron/last_run/enabled changed since
+        # they were queued need a croniter evaluation here.
+        jobs_by_name: Dict[str, Dict[str, Any]] = {}
         for job in self.jobs:
-            if not job.get("enabled", True):
+            jobs_by_name[job["name"]] = job
+            entry = self._scheduled.get(job["name"])
+            if entry is None or entry[0] != self._schedule_key(job):
+                self._queue_job(job, now)
+
+        ready: List[Dict[str, Any]] = []
+        while self._heap and self._heap[0][0] <= now_ts:
+            due, seq, name = heapq.heappop(self._heap)
+            entry = self._scheduled.get(name)
+            job = jobs_by_name.get(name)
+            if job is None:
+                self._scheduled.pop(name, None)
                 continue
+            if entry is None or entry[1] != seq:
+                continue  # superseded by a newer entry
 
-            try:
-                cron = croniter(job["cron"], now)
-
-                last_run_ts = job.get("last_run")
-                prev_run_time = cron.get_prev(datetime)
-
-                should_run = False
-                if last_run_ts is None:
-                    # If never run, run if scheduled time was within last 60s
-                    if (now - prev_run_time).total_seconds() < 60:
-                        should_run = True
-                else:
-                    last_run_dt = datetime.fromtimestamp(last_run_ts)
-                    if prev_run_time > last_run_dt:
-                        should_run = True
-
-                if should_run:
-                    logger.info(f"Running job: {job['name']}")
-                    await self._execute_job(job)
-                    job["last_run"] = now.timestamp()
-                    self._save_jobs()
-            except Exception as e:
-                logger.error(f"Error checking job {job['name']}: {e}")
+            if job.get("last_run") is None and due <= now_ts - FIRST_RUN_WINDOW.total_seconds():
+                # Missed its first-run window; wait for the next scheduled time
+                self._queue_job(job, now)
+                continue
+
+            ready.append(job)
+
+        if not ready:
+            return
+
+        # Due jobs are mostly I/O bound, so let them overlap
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_JOBS)
+
+        async def run_one(job: Dict[str, Any]) -> None:
+            async with semaphore:
+                logger.info(f"Running job: {job['name']}")
+                await self._execute_job(job)
+            job["last_run"] = now_ts
+
+        results = await asyncio.gather(*(run_one(job) for job in ready), return_exceptions=True)
+        for job, result in zip(ready, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error checking job {job['name']}: {result}")
+        self._save_jobs(durable=False)
+
+        # Requeue only now, so a job that failed before its last_run was
+        # stamped is retried next tick rather than again right away.
+        for job in ready:
+            self._queue_job(job, now)
 
     async def run_now(self, job_name: str) -> bool:
         """Manually run a specific job immediately."""
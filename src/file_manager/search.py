@@ -1,12 +1,28 @@
 import os
+import re
+import mmap
 import fnmatch
 from pathlib import Path
 from typing import List, Optional, Union, Iterator
-from .utils import recursive_scan
+from .utils import map_in_pool, recursive_scan
 from .plugins.registry import PluginRegistry
 from .tags import TagManager
 
 FILE_TYPE_CHECK_BYTES = 1024
+# Extensions treated as text without looking at the file
+TEXT_EXTENSIONS = frozenset({
+    ".txt", ".md", ".py", ".js", ".java", ".c", ".cpp", ".h",
+    ".json", ".xml", ".html", ".css", ".sh", ".bash", ".yaml",
+    ".yml", ".ini", ".cfg", ".conf", ".log", ".csv"
+})
+# Files at least this large are searched through an mmap; smaller ones are read
+MMAP_SEARCH_THRESHOLD = 256 * 1024
+# Window size for case-insensitive scans of a mapped file
+CONTENT_SEARCH_CHUNK_SIZE = 1024 * 1024
+# Files checked per pool task in a content search
+CONTENT_SEARCH_BATCH_SIZE = 64
+# Entries stat'ed per pool task in a size search
+STAT_BATCH_SIZE = 256
 
 class FileSearcher:
     """Class for searching files."""
@@ -14,7 +30,7 @@ class FileSearcher:
     def __init__(self):
         self.results: List[Path] = []
         self.plugins = PluginRegistry()
-        self.plugins.load_plugins()
+        self.plugins.ensure_loaded()
         self.tag_manager = TagManager()
     
     def search_by_tag(self, tag: str) -> List[Path]:
@@ -42,7 +58,9 @@ class FileSearcher:
         
         if not case_sensitive:
             pattern = pattern.lower()
-        
+        # Translate the glob once rather than going through fnmatch per name
+        match = re.compile(fnmatch.translate(pattern)).match
+
         try:
             entries_iter: Iterator[os.DirEntry[str]]
             if recursive:
@@ -55,7 +73,7 @@ class FileSearcher:
                     name = entry.name
                     check_name = name if case_sensitive else name.lower()
 
-                    if fnmatch.fnmatch(check_name, pattern):
+                    if match(check_name):
                         results.append(Path(entry.path))
                 except OSError:
                     continue
@@ -77,12 +95,13 @@ class FileSearcher:
         """
         Search for files containing specific text.
         """
-        results: List[Path] = []
         search_term = search_text if case_sensitive else search_text.lower()
         
         if not search_term:
             return []
 
+        name_match = re.compile(fnmatch.translate(file_pattern)).match
+        candidates: List[Path] = []
         try:
             # Iterate over all files recursively
             for entry in recursive_scan(directory):
@@ -90,25 +109,28 @@ class FileSearcher:
                     if not entry.is_file(follow_symlinks=False):
                         continue
 
-                    if not fnmatch.fnmatch(entry.name, file_pattern):
-                        continue
-
-                    file_path = Path(entry.path)
-
-                    # Check if text file
-                    if not self._is_text_file(file_path):
-                        continue
-
-                    # Check content
-                    if self._file_contains_term(file_path, search_term, case_sensitive):
-                        results.append(file_path)
-
+                    if name_match(entry.name):
+                        candidates.append(Path(entry.path))
                 except OSError:
                     continue
 
         except (PermissionError, OSError):
             pass
-        
+
+        # Opening and scanning files is the slow part; spread it over the pool.
+        # Files without a known text extension are sniffed for binary content
+        # through the same open as the scan, not a separate _is_text_file call.
+        def matches(file_path: Path) -> bool:
+            return self._file_contains_term(
+                file_path,
+                search_term,
+                case_sensitive,
+                skip_binary=file_path.suffix.lower() not in TEXT_EXTENSIONS
+            )
+
+        found = map_in_pool(matches, candidates, CONTENT_SEARCH_BATCH_SIZE)
+        results = [path for path, hit in zip(candidates, found) if hit]
+
         self.results = results
         self.plugins.on_search_complete(search_text, results)
         return results
@@ -123,8 +145,7 @@ class FileSearcher:
         """
         Search for files by size range.
         """
-        results: List[Path] = []
-        
+        files: List[os.DirEntry[str]] = []
         try:
             entries_iter: Iterator[os.DirEntry[str]]
             if recursive:
@@ -134,27 +155,36 @@ class FileSearcher:
 
             for entry in entries_iter:
                 try:
-                    if not entry.is_file(follow_symlinks=True):
-                        continue
-
-                    size = entry.stat().st_size
-
-                    if min_size is not None and size < min_size:
-                        continue
-                    if max_size is not None and size > max_size:
-                        continue
-
-                    results.append(Path(entry.path))
+                    if entry.is_file(follow_symlinks=True):
+                        files.append(entry)
                 except OSError:
                     continue
         except (PermissionError, OSError):
             pass
 
+        # Each stat() is a syscall on a possibly cold inode; overlap them
+        sizes = map_in_pool(self._entry_size, files, STAT_BATCH_SIZE)
+        results = [
+            Path(entry.path)
+            for entry, size in zip(files, sizes)
+            if size is not None
+            and (min_size is None or size >= min_size)
+            and (max_size is None or size <= max_size)
+        ]
+
         self.results = results
         size_range = f"{min_size}-{max_size}"
         self.plugins.on_search_complete(f"size:{size_range}", results)
         return results
 
+    @staticmethod
+    def _entry_size(entry: os.DirEntry) -> Optional[int]:
+        """Size of a scanned file, or None if it can no longer be stat'ed."""
+        try:
+            return entry.stat().st_size
+        except OSError:
+            return None
+
     def _scandir_safe(self, directory: Union[Path, str]) -> Iterator[os.DirEntry[str]]:
         """Safe wrapper around os.scandir that yields entries."""
         try:
@@ -165,8 +195,75 @@ class FileSearcher:
             return
 
     @staticmethod
-    def _file_contains_term(file_path: Path, search_term: str, case_sensitive: bool) -> bool:
-        """Check if a file contains the search term."""
+    def _file_contains_term(
+        file_path: Path,
+        search_term: str,
+        case_sensitive: bool,
+        skip_binary: bool = False
+    ) -> bool:
+        """
+        Check if a file contains the search term.
+        With skip_binary, files _is_text_file would reject are reported as
+        non-matching, using the same open as the scan itself.
+        """
+        needle = search_term.encode("utf-8")
+        # bytes.lower() only folds ASCII, so decode for anything else
+        decode = not case_sensitive and not needle.isascii()
+        if not case_sensitive:
+            needle = needle.lower()
+
+        try:
+            with open(file_path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                # Byte-level matches can't be longer than the file; decoded
+                # case folding can change lengths, so it gets no shortcut
+                if size < len(needle) and not decode:
+                    return False
+
+                head = b""
+                if skip_binary:
+                    head = f.read(FILE_TYPE_CHECK_BYTES)
+                    if _looks_binary(head):
+                        return False
+                if decode:
+                    return FileSearcher._text_contains_term(file_path, search_term, case_sensitive)
+
+                if size < MMAP_SEARCH_THRESHOLD:
+                    # Setting up a mapping costs more than reading a small file
+                    data = head + f.read()
+                    if not case_sensitive:
+                        data = data.lower()
+                    return needle in data
+
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    return False  # Empty files cannot be mapped and hold nothing
+                except OSError:
+                    return FileSearcher._text_contains_term(file_path, search_term, case_sensitive)
+
+                with mm:
+                    # Scanned front to back once: let the kernel read ahead
+                    # further and drop pages behind the scan sooner.
+                    if hasattr(mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    if case_sensitive:
+                        return mm.find(needle) != -1
+
+                    # Lowercase one window at a time; overlap so a match
+                    # straddling two windows is still seen.
+                    overlap = len(needle) - 1
+                    for start in range(0, len(mm), CONTENT_SEARCH_CHUNK_SIZE):
+                        window = mm[max(0, start - overlap):start + CONTENT_SEARCH_CHUNK_SIZE]
+                        if needle in window.lower():
+                            return True
+        except (IOError, OSError):
+            pass
+        return False
+
+    @staticmethod
+    def _text_contains_term(file_path: Path, search_term: str, case_sensitive: bool) -> bool:
+        """Line-by-line decoded scan, for terms the byte scan can't fold."""
         try:
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 for line in f:
@@ -181,22 +278,16 @@ class FileSearcher:
     @staticmethod
     def _is_text_file(file_path: Path) -> bool:
         """Check if a file is likely a text file."""
-        text_extensions = {
-            ".txt", ".md", ".py", ".js", ".java", ".c", ".cpp", ".h",
-            ".json", ".xml", ".html", ".css", ".sh", ".bash", ".yaml",
-            ".yml", ".ini", ".cfg", ".conf", ".log", ".csv"
-        }
-        
-        if file_path.suffix.lower() in text_extensions:
+        if file_path.suffix.lower() in TEXT_EXTENSIONS:
             return True
 
         try:
             with open(file_path, "rb") as f:
-                chunk = f.read(FILE_TYPE_CHECK_BYTES)
-                if not chunk:
-                    return True # Empty file is text
-                if b"\x00" in chunk:
-                    return False
-                return True
+                return not _looks_binary(f.read(FILE_TYPE_CHECK_BYTES))
         except (IOError, OSError):
             return False
+
+
+def _looks_binary(head: bytes) -> bool:
+    """Whether the first FILE_TYPE_CHECK_BYTES of a file mark it as binary."""
+    return b"\x00" in head
@@ -4,8 +4,11 @@ Tagging system for File Manager.
 
 import sqlite3
 import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Iterator, List, Optional, Tuple, Dict, Union
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +21,10 @@ class TagManager:
     based on natural language commands or AI suggestions from filenames and context.
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Union[Path, str]] = None):
+        # db_path may also be ":memory:"; the database then lives only as
+        # long as the shared connection, and starts out empty after close().
+        self.db_path: Union[Path, str]
         if db_path is None:
             # Default to ~/.tfm/tags.db
             home = Path.home()
@@ -28,27 +34,85 @@ class TagManager:
         else:
             self.db_path = db_path
 
+        # One connection for the manager's lifetime, opened on first use.
+        # It may be used from worker threads, so access is serialised.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection to the tags database.
+        In WAL mode synchronous=NORMAL only syncs at checkpoints, so a commit
+        no longer waits on an fsync; it is a per-connection setting.
+        Sorting and grouping for tag listings keep temp b-trees in memory.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the shared connection for one transaction.
+        A newly opened connection gets the schema first, so a ":memory:"
+        database reopened after close() is usable, if empty.
+        """
+        with self._lock:
+            if self._conn is None:
+                conn = self._connect()
+                try:
+                    with conn:
+                        self._create_schema(conn)
+                except sqlite3.Error:
+                    conn.close()
+                    raise
+                self._conn = conn
+            with self._conn:
+                yield self._conn
+
+    def close(self) -> None:
+        """
+        Close the shared connection; the next call reopens it.
+        A ":memory:" database is discarded and comes back empty.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
     def _init_db(self):
-        """Initialize the database schema."""
+        """Open the database, creating the schema if needed."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS tags (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        file_path TEXT NOT NULL,
-                        tag TEXT NOT NULL,
-                        UNIQUE(file_path, tag)
-                    )
-                """)
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_tag ON tags (tag)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_file_path ON tags (file_path)")
-                conn.commit()
+            with self._transaction():
+                pass
         except sqlite3.Error as e:
             logger.error(f"Failed to initialize tags database: {e}")
 
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> None:
+        """Create the tags table and its indexes if they don't exist."""
+        cursor = conn.cursor()
+        # WAL is persistent for the database file and lets commits
+        # append to the log instead of rewriting the main file.
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tags (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_path TEXT NOT NULL,
+                tag TEXT NOT NULL,
+                UNIQUE(file_path, tag)
+            )
+        """)
+        # UNIQUE(file_path, tag) already indexes lookups by file;
+        # (tag, file_path) covers lookups and counts by tag, so
+        # neither needs to touch the table itself.
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tag_file ON tags (tag, file_path)")
+        # Superseded by the two indexes above; dropped from older databases
+        cursor.execute("DROP INDEX IF EXISTS idx_tag")
+        cursor.execute("DROP INDEX IF EXISTS idx_file_path")
+
     def add_tag(self, file_path: Path, tag: str) -> bool:
         """Add a tag to a file."""
         path_str = str(file_path.resolve())
@@ -57,7 +121,7 @@ class TagManager:
             return False
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "INSERT OR IGNORE INTO tags (file_path, tag) VALUES (?, ?)",
@@ -69,13 +133,46 @@ class TagManager:
             logger.error(f"Failed to add tag: {e}")
             return False
 
+    def add_tags(self, items: List[Tuple[Path, str]]) -> int:
+        """
+        Add many (file, tag) pairs in a single transaction.
+        Returns the number of new tag assignments.
+        """
+        rows = []
+        # Files usually arrive with several tags each; resolve each once.
+        # Nothing is kept across calls, since links and cwd can change.
+        resolved: Dict[Path, str] = {}
+        for file_path, tag in items:
+            tag = tag.strip()
+            if not tag:
+                continue
+            path_str = resolved.get(file_path)
+            if path_str is None:
+                path_str = resolved[file_path] = str(file_path.resolve())
+            rows.append((path_str, tag))
+        if not rows:
+            return 0
+
+        try:
+            with self._transaction() as conn:
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO tags (file_path, tag) VALUES (?, ?)",
+                    rows
+                )
+                conn.commit()
+                return conn.total_changes - before
+        except sqlite3.Error as e:
+            logger.error(f"Failed to add tags: {e}")
+            return 0
+
     def remove_tag(self, file_path: Path, tag: str) -> bool:
         """Remove a tag from a file."""
         path_str = str(file_path.resolve())
         tag = tag.strip()
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "DELETE FROM tags WHERE file_path = ? AND tag = ?",
@@ -92,7 +189,7 @@ class TagManager:
         path_str = str(file_path.resolve())
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT tag FROM tags WHERE file_path = ?",
@@ -108,7 +205,7 @@ class TagManager:
         tag = tag.strip()
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT file_path FROM tags WHERE tag = ?",
@@ -127,7 +224,7 @@ class TagManager:
     def list_all_tags(self) -> List[Tuple[str, int]]:
         """List all tags and their usage count."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     "SELECT tag, COUNT(*) FROM tags GROUP BY tag ORDER BY COUNT(*) DESC"
@@ -139,16 +236,18 @@ class TagManager:
 
     def get_all_tags_export(self) -> Dict[str, List[str]]:
         """Export all tags as a dictionary {file_path: [tags]}."""
-        export_data: Dict[str, List[str]] = {}
+        export_data: Dict[str, List[str]] = defaultdict(list)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
+                # Rows are streamed in batches rather than materialised with
+                # fetchall(); ORDER BY is served by the UNIQUE(file_path, tag) index.
+                cursor.arraysize = 1000
                 cursor.execute("SELECT file_path, tag FROM tags ORDER BY file_path")
-                for path_str, tag in cursor.fetchall():
-                    if path_str not in export_data:
-                        export_data[path_str] = []
-                    export_data[path_str].append(tag)
-                return export_data
+                while rows := cursor.fetchmany():
+                    for path_str, tag in rows:
+                        export_data[path_str].append(tag)
+                return dict(export_data)
         except sqlite3.Error as e:
             logger.error(f"Failed to export tags: {e}")
             return {}
@@ -161,7 +260,7 @@ class TagManager:
         """Remove entries for files that no longer exist."""
         removed_count = 0
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute("SELECT DISTINCT file_path FROM tags")
                 files = cursor.fetchall()
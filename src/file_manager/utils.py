@@ -1,7 +1,23 @@
 import shutil
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union, Generator
+from typing import Callable, Iterable, List, Optional, Sequence, TypeVar, Union, Generator
+
+# Executable names tried by find_gemini_executable, in order: the standard
+# install first, then the Termux package
+GEMINI_EXECUTABLES = ("gemini", "gemini-cli-termux")
+
+# Workers in the pool shared by per-file search and hashing work
+SHARED_POOL_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_shared_pool: Optional[ThreadPoolExecutor] = None
+_shared_pool_lock = threading.Lock()
 
 def format_size(size_bytes: int) -> str:
     """Format size in bytes to human readable string."""
@@ -12,20 +28,18 @@ def format_size(size_bytes: int) -> str:
         f_size /= 1024.0
     return f"{f_size:.1f} PB"
 
+@lru_cache(maxsize=1)
 def find_gemini_executable() -> Optional[str]:
     """
     Finds the path to the gemini executable.
     Checks for 'gemini' and 'gemini-cli-termux'.
+    The PATH search runs once per process; call
+    find_gemini_executable.cache_clear() to look again.
     """
-    # Check for 'gemini' first (standard install)
-    gemini_path = shutil.which("gemini")
-    if gemini_path:
-        return gemini_path
-
-    # Check for 'gemini-cli-termux' (explicit package name)
-    gemini_path = shutil.which("gemini-cli-termux")
-    if gemini_path:
-        return gemini_path
+    for name in GEMINI_EXECUTABLES:
+        gemini_path = shutil.which(name)
+        if gemini_path:
+            return gemini_path
 
     return None
 
@@ -45,3 +59,39 @@ def recursive_scan(directory: Union[Path, str]) -> Generator[os.DirEntry, None,
                         stack.append(entry.path)
         except (PermissionError, OSError):
             pass
+
+def get_shared_pool() -> ThreadPoolExecutor:
+    """
+    Return the process-wide pool for blocking per-file work.
+    Created on first use so importing the package starts no threads.
+    Callers must not wait on it from one of its own workers.
+    """
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = ThreadPoolExecutor(
+                    max_workers=SHARED_POOL_WORKERS, thread_name_prefix="tfm"
+                )
+    return _shared_pool
+
+def map_in_pool(func: Callable[[T], R], items: Sequence[T], batch_size: int) -> List[R]:
+    """
+    Apply func to items on the shared pool, batch_size items per task.
+    Results come back in input order; a single batch runs inline.
+    """
+    if len(items) <= batch_size:
+        return [func(item) for item in items]
+
+    def run_batch(batch: Iterable[T]) -> List[R]:
+        return [func(item) for item in batch]
+
+    pool = get_shared_pool()
+    futures = [
+        pool.submit(run_batch, items[start:start + batch_size])
+        for start in range(0, len(items), batch_size)
+    ]
+    results: List[R] = []
+    for future in futures:
+        results.extend(future.result())
+    return results
@@ -0,0 +1,28 @@
+"""
+Shared pytest configuration for the TFM test suite.
+"""
+
+import os
+import sys
+
+# Test runs don't need the .pyc files they would otherwise leave behind.
+sys.dont_write_bytecode = True
+
+# installer/ holds a standalone script rather than a package; make it
+# importable once here instead of from each test module.
+INSTALLER_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "installer")
+if INSTALLER_DIR not in sys.path:
+    sys.path.insert(0, INSTALLER_DIR)
+
+
+def pytest_configure(config):
+    """
+    Opt-in: with TFM_TMPFS set to a writable directory (e.g. /dev/shm), put
+    the pytest workspace there unless --basetemp was given explicitly.
+    Only tmp_path is moved; tempfile use by the code under test is not.
+    """
+    ramdisk = os.environ.get("TFM_TMPFS")
+    if not ramdisk or config.option.basetemp:
+        return
+    if os.path.isdir(ramdisk) and os.access(ramdisk, os.W_OK):
+        config.option.basetemp = os.path.join(ramdisk, "tfm-pytest")
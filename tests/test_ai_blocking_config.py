@@ -1,5 +1,4 @@
 
-import pytest
 import time
 import asyncio
 from textual.app import App, ComposeResult
@@ -22,7 +21,6 @@ class MockApp(App):
         screen.ai = SlowAIExecutor()
         yield screen
 
-@pytest.mark.asyncio
 async def test_non_blocking_behavior():
     app = MockApp()
     async with app.run_test() as pilot:
@@ -77,7 +77,6 @@ def test_generate_plan_retry(gemini_client, tmp_path):
     assert len(plan["plan"]) == 0
     assert gemini_client.executor.execute_prompt.call_count == 2
 
-@pytest.mark.asyncio
 async def test_execute_plan_step(gemini_client):
     step = {
         "step": 1,
@@ -1,5 +1,4 @@
 import json
-import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -11,7 +10,6 @@ class MockApp(App):
     def compose(self):
         yield AIModeScreen()
 
-@pytest.mark.asyncio
 async def test_ai_pipeline_e2e_plan_execution(tmp_path):
     # Setup mock files
     source_dir = tmp_path / "source"
@@ -59,15 +57,16 @@ async def test_ai_pipeline_e2e_plan_execution(tmp_path):
             dry_run.value = False # Disable dry run for real execution
 
             # Wait for any prior events, then trigger worker directly to bypass async/thread test quirks
-            await pilot.pause(0.1)
-            screen._generate_plan_worker(cmd_input.value, Path(target_input.value), dry_run.value)
-            await pilot.pause(2.0)
+            await pilot.pause()
+            worker = screen._generate_plan_worker(cmd_input.value, Path(target_input.value), dry_run.value)
+            # Wait for the worker itself rather than a fixed sleep
+            await worker.wait()
+            await pilot.pause()
 
             # Ensure execution triggered organizer
             assert len(screen.current_plan) > 0
             assert screen.current_plan[0]["action"] == "organize_by_type"
 
-@pytest.mark.asyncio
 async def test_ai_pipeline_e2e_validation_fallback(tmp_path):
     # Test fallback text on complete failure
     with patch("src.file_manager.ai_integration.AIExecutor") as mock_executor_cls:
@@ -86,9 +85,10 @@ async def test_ai_pipeline_e2e_validation_fallback(tmp_path):
             cmd_input = screen.query_one("#command_input", Input)
             cmd_input.value = "Do something bad"
 
-            await pilot.pause(0.1)
-            screen._generate_plan_worker(cmd_input.value, Path(target_input.value), True)
-            await pilot.pause(2.0)
+            await pilot.pause()
+            worker = screen._generate_plan_worker(cmd_input.value, Path(target_input.value), True)
+            await worker.wait()
+            await pilot.pause()
 
             # Verify plan is empty and fallback logic triggered
             log_widget = screen.query_one("#output_log", RichLog)
@@ -1,20 +1,14 @@
 import pytest
 import asyncio
-import tempfile
 import os
-from pathlib import Path
 from src.file_manager.automation import FileOrganizer, ConflictResolutionStrategy
 
-@pytest.mark.asyncio
 class TestAutomationAsync:
 
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_dir = Path(self.temp_dir.name)
+    def setup(self, tmp_path):
+        self.test_dir = tmp_path
         self.organizer = FileOrganizer()
-        yield
-        self.temp_dir.cleanup()
 
     async def test_organize_by_type(self):
         # Create test files
@@ -1,14 +1,21 @@
+import os
 import pytest
+from datetime import datetime
+from pathlib import Path
 from src.file_manager.automation import FileOrganizer, ConflictResolutionStrategy
 from unittest.mock import patch
 
+def _touch_many(directory, names):
+    """Create empty files without Path.touch()'s extra utime call."""
+    for name in names:
+        os.close(os.open(os.path.join(directory, name), os.O_WRONLY | os.O_CREAT, 0o644))
+
 @pytest.fixture
 def organizer(tmp_path):
     org = FileOrganizer()
     org.file_ops.trash_dir = tmp_path / "trash"
     return org
 
-@pytest.mark.asyncio
 async def test_organize_by_date_empty(organizer, tmp_path):
     source = tmp_path / "src"
     target = tmp_path / "dst"
@@ -17,13 +24,11 @@ async def test_organize_by_date_empty(organizer, tmp_path):
     result = await organizer.organize_by_date(source, target)
     assert result == {}
 
-@pytest.mark.asyncio
 async def test_organize_by_date_fail_read(organizer, tmp_path):
     source = tmp_path / "nonexistent"
     result = await organizer.organize_by_date(source, tmp_path / "dst")
     assert result == {}
 
-@pytest.mark.asyncio
 async def test_find_duplicates_recursive(organizer, tmp_path):
     d1 = tmp_path / "d1"
     d1.mkdir()
@@ -40,7 +45,6 @@ async def test_find_duplicates_recursive(organizer, tmp_path):
     hash_val = list(dups.keys())[0]
     assert len(dups[hash_val]) == 2
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_newest(organizer, tmp_path):
     import time
     f1 = tmp_path / "f1.txt"
@@ -55,7 +59,6 @@ async def test_resolve_duplicates_newest(organizer, tmp_path):
     assert len(deleted) == 1
     assert deleted[0] == f1
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_oldest(organizer, tmp_path):
     import time
     f1 = tmp_path / "f1.txt"
@@ -70,7 +73,6 @@ async def test_resolve_duplicates_oldest(organizer, tmp_path):
     assert len(deleted) == 1
     assert deleted[0] == f2
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_largest(organizer, tmp_path):
     f1 = tmp_path / "f1.txt"
     f2 = tmp_path / "f2.txt"
@@ -82,7 +84,6 @@ async def test_resolve_duplicates_largest(organizer, tmp_path):
     assert len(deleted) == 1
     assert deleted[0] == f1
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_smallest(organizer, tmp_path):
     f1 = tmp_path / "f1.txt"
     f2 = tmp_path / "f2.txt"
@@ -94,12 +95,10 @@ async def test_resolve_duplicates_smallest(organizer, tmp_path):
     assert len(deleted) == 1
     assert deleted[0] == f2
 
-@pytest.mark.asyncio
 async def test_batch_rename_empty_pattern(organizer, tmp_path):
     with pytest.raises(ValueError):
         await organizer.batch_rename(tmp_path, "", "new")
 
-@pytest.mark.asyncio
 async def test_batch_rename_fail_rename(organizer, tmp_path):
     f1 = tmp_path / "test1.txt"
     f1.write_text("t")
@@ -110,7 +109,6 @@ async def test_batch_rename_fail_rename(organizer, tmp_path):
         renamed = await organizer.batch_rename(tmp_path, "test", "new")
         assert len(renamed) == 0
 
-@pytest.mark.asyncio
 async def test_find_duplicates_non_recursive(organizer, tmp_path):
     d1 = tmp_path / "d1"
     d1.mkdir()
@@ -130,7 +128,6 @@ async def test_find_duplicates_non_recursive(organizer, tmp_path):
     assert f3 in dups[hash_val]
     assert f4 in dups[hash_val]
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_interactive(organizer, tmp_path):
     f1 = tmp_path / "f1.txt"
     f2 = tmp_path / "f2.txt"
@@ -141,7 +138,6 @@ async def test_resolve_duplicates_interactive(organizer, tmp_path):
     deleted = await organizer.resolve_duplicates(dups, ConflictResolutionStrategy.INTERACTIVE)
     assert len(deleted) == 0 # Interactive skips auto-deletion
 
-@pytest.mark.asyncio
 async def test_batch_rename_dry_run(organizer, tmp_path):
     f1 = tmp_path / "test1.txt"
     f1.write_text("t")
@@ -151,7 +147,6 @@ async def test_batch_rename_dry_run(organizer, tmp_path):
     assert f1.exists()
     assert not (tmp_path / "new1.txt").exists()
 
-@pytest.mark.asyncio
 async def test_organize_by_type_invalid_category(organizer, tmp_path):
     source = tmp_path / "src"
     source.mkdir()
@@ -162,7 +157,6 @@ async def test_organize_by_type_invalid_category(organizer, tmp_path):
     result = await organizer.organize_by_type(source, tmp_path / "dst")
     assert result == {}
 
-@pytest.mark.asyncio
 async def test_cleanup_old_files_dry_run(organizer, tmp_path):
     import time
     source = tmp_path / "src"
@@ -179,7 +173,6 @@ async def test_cleanup_old_files_dry_run(organizer, tmp_path):
     assert len(old_files) == 1
     assert f1.exists() # Should not be deleted
 
-@pytest.mark.asyncio
 async def test_organize_by_date_dry_run(organizer, tmp_path):
     source = tmp_path / "src"
     target = tmp_path / "dst"
@@ -192,7 +185,23 @@ async def test_organize_by_date_dry_run(organizer, tmp_path):
     # Check target dir was NOT created
     assert not target.exists()
 
-@pytest.mark.asyncio
+async def test_organize_by_date_uses_entry_stat(organizer, tmp_path):
+    source = tmp_path / "src"
+    source.mkdir()
+    f1 = source / "a.txt"
+    f1.touch()
+    os.utime(f1, (0, 1_600_000_000))
+    (source / "sub").mkdir()
+
+    # The scandir entry's cached stat is the only one taken per source file
+    with patch("pathlib.Path.stat", autospec=True, side_effect=Path.stat) as mock_stat:
+        result = await organizer.organize_by_date(source, tmp_path / "dst", dry_run=True)
+
+    key = datetime.fromtimestamp(1_600_000_000).strftime("%Y/%m")
+    assert list(result) == [key]
+    stat_paths = [call.args[0] for call in mock_stat.call_args_list]
+    assert not [p for p in stat_paths if p.parent == source]
+
 async def test_organize_generic_file_error(organizer, tmp_path):
     source = tmp_path / "src"
     target = tmp_path / "dst"
@@ -206,14 +215,12 @@ async def test_organize_generic_file_error(organizer, tmp_path):
         # Wait, if it fails, it won't add to `organized_files` dict
         assert result == {}
 
-@pytest.mark.asyncio
 async def test_find_duplicates_oserror(organizer, tmp_path):
     # Pass in a path that throws permission error for scandir
     with patch("os.scandir", side_effect=PermissionError("mocked perm error")):
         dups = await organizer.find_duplicates(tmp_path, recursive=False)
         assert dups == {}
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_oserror(organizer, tmp_path):
     f1 = tmp_path / "f1.txt"
     f2 = tmp_path / "f2.txt"
@@ -222,7 +229,6 @@ async def test_resolve_duplicates_oserror(organizer, tmp_path):
     deleted = await organizer.resolve_duplicates(dups, ConflictResolutionStrategy.KEEP_NEWEST)
     assert len(deleted) == 0
 
-@pytest.mark.asyncio
 async def test_cleanup_old_files_oserror(organizer, tmp_path):
     f1 = tmp_path / "old.txt"
     f1.touch()
@@ -232,7 +238,6 @@ async def test_cleanup_old_files_oserror(organizer, tmp_path):
             old_files = await organizer.cleanup_old_files(tmp_path, days_old=1)
             assert len(old_files) == 0
 
-@pytest.mark.asyncio
 async def test_compute_file_hash_oserror(organizer, tmp_path):
     f1 = tmp_path / "hash.txt"
     # Doesn't exist, so _compute_file_hash raises FileNotFoundError -> caught inside loop?
@@ -241,7 +246,6 @@ async def test_compute_file_hash_oserror(organizer, tmp_path):
     with pytest.raises(OSError):
         organizer._compute_file_hash(f1)
 
-@pytest.mark.asyncio
 async def test_scan_recursive(organizer, tmp_path):
     from src.file_manager.utils import recursive_scan
     d1 = tmp_path / "d1"
@@ -253,7 +257,6 @@ async def test_scan_recursive(organizer, tmp_path):
     assert len(res) == 1
     assert res[0].name == "f1.txt"
 
-@pytest.mark.asyncio
 async def test_find_duplicates_symlink(organizer, tmp_path):
     import os
     d1 = tmp_path / "d1"
@@ -266,7 +269,6 @@ async def test_find_duplicates_symlink(organizer, tmp_path):
     dups = await organizer.find_duplicates(d1, recursive=True)
     assert len(dups) == 1
 
-@pytest.mark.asyncio
 async def test_batch_rename_dry_run_dot(organizer, tmp_path):
     f1 = tmp_path / "test1.txt"
     f1.write_text("t")
@@ -274,7 +276,6 @@ async def test_batch_rename_dry_run_dot(organizer, tmp_path):
     renamed = await organizer.batch_rename(tmp_path, "test1.txt", "..")
     assert len(renamed) == 0
 
-@pytest.mark.asyncio
 async def test_find_duplicates_size_oserror(organizer, tmp_path):
     d1 = tmp_path / "d1"
     d1.mkdir()
@@ -287,7 +288,6 @@ async def test_find_duplicates_size_oserror(organizer, tmp_path):
         dups = await organizer.find_duplicates(d1, recursive=False)
         assert dups == {}
 
-@pytest.mark.asyncio
 async def test_find_duplicates_partial_hash_oserror(organizer, tmp_path):
     d1 = tmp_path / "d1"
     d1.mkdir()
@@ -300,7 +300,6 @@ async def test_find_duplicates_partial_hash_oserror(organizer, tmp_path):
         dups = await organizer.find_duplicates(d1, recursive=False)
         assert dups == {}
 
-@pytest.mark.asyncio
 async def test_find_duplicates_full_hash_oserror(organizer, tmp_path):
     d1 = tmp_path / "d1"
     d1.mkdir()
@@ -313,7 +312,6 @@ async def test_find_duplicates_full_hash_oserror(organizer, tmp_path):
         dups = await organizer.find_duplicates(d1, recursive=False)
         assert dups == {}
 
-@pytest.mark.asyncio
 async def test_organize_get_unique_path(organizer, tmp_path):
     f1 = tmp_path / "test.txt"
     f1.touch()
@@ -323,7 +321,6 @@ async def test_organize_get_unique_path(organizer, tmp_path):
     res = organizer._get_unique_path(f1)
     assert res.name == "test_2.txt"
 
-@pytest.mark.asyncio
 async def test_partial_hash_small_file(organizer, tmp_path):
     f1 = tmp_path / "test.txt"
     f1.write_text("small")
@@ -331,10 +328,95 @@ async def test_partial_hash_small_file(organizer, tmp_path):
     # Since it is small, it hashes whole file
     assert hash1 == organizer._compute_file_hash(f1)
 
-@pytest.mark.asyncio
 async def test_partial_hash_large_file(organizer, tmp_path):
     f1 = tmp_path / "test.txt"
     # Make it exactly larger than 2 * 65536
     f1.write_bytes(b"a" * (2 * 65536 + 10))
     hash1 = organizer._compute_partial_hash(f1, chunk_size=65536)
     assert hash1 is not None
+
+async def test_find_duplicates_same_head_different_tail(organizer, tmp_path):
+    head = b"x" * 20000
+    (tmp_path / "a.bin").write_bytes(head + b"tail-a")
+    (tmp_path / "b.bin").write_bytes(head + b"tail-b")
+    (tmp_path / "c.bin").write_bytes(head + b"tail-a")
+
+    dups = await organizer.find_duplicates(tmp_path, recursive=False)
+
+    assert len(dups) == 1
+    group = next(iter(dups.values()))
+    assert sorted(p.name for p in group) == ["a.bin", "c.bin"]
+
+async def test_find_duplicates_large_files_mmap(organizer, tmp_path):
+    # Larger than MMAP_HASH_THRESHOLD; head and tail agree, middle differs
+    from src.file_manager.automation import MMAP_HASH_THRESHOLD
+    content = bytearray(b"z" * (MMAP_HASH_THRESHOLD + 1024))
+    (tmp_path / "a.bin").write_bytes(content)
+    (tmp_path / "b.bin").write_bytes(content)
+    content[len(content) // 2] = ord("y")
+    (tmp_path / "c.bin").write_bytes(content)
+
+    dups = await organizer.find_duplicates(tmp_path, recursive=False)
+
+    assert len(dups) == 1
+    group = next(iter(dups.values()))
+    assert sorted(p.name for p in group) == ["a.bin", "b.bin"]
+
+async def test_find_duplicates_rotational_hashes_inline(organizer, tmp_path):
+    import threading
+    for name in ("a.bin", "b.bin", "c.bin"):
+        (tmp_path / name).write_bytes(b"q" * 20000)
+
+    callers = []
+    original = organizer._full_hash_or_none
+
+    def record(*args):
+        callers.append(threading.current_thread())
+        return original(*args)
+
+    with patch("src.file_manager.automation._is_rotational", return_value=True), \
+         patch.object(organizer, "_full_hash_or_none", side_effect=record):
+        dups = await organizer.find_duplicates(tmp_path, recursive=False)
+
+    assert len(next(iter(dups.values()))) == 3
+    assert len(callers) == 3 and len(set(callers)) == 1
+
+def test_is_rotational_missing_path(tmp_path):
+    from src.file_manager.automation import _is_rotational
+    assert _is_rotational(tmp_path / "missing") is False
+
+def test_compute_file_hash_reused_buffer(tmp_path):
+    big = tmp_path / "big.bin"
+    small = tmp_path / "small.bin"
+    big.write_bytes(b"b" * 300000)
+    small.write_bytes(b"b" * 10)
+
+    # The small file reuses the big file's buffer; stale bytes must not leak in
+    FileOrganizer._compute_file_hash(big)
+    small_hash = FileOrganizer._compute_file_hash(small)
+    (tmp_path / "copy.bin").write_bytes(b"b" * 10)
+    assert small_hash == FileOrganizer._compute_file_hash(tmp_path / "copy.bin")
+    assert small_hash != FileOrganizer._compute_file_hash(big)
+
+async def test_organize_many_collisions_lists_target_once(organizer, tmp_path):
+    source = tmp_path / "src"
+    target = tmp_path / "dst"
+    source.mkdir()
+    (source / "test_image.jpg").write_bytes(b"new")
+
+    # Pre-populate the destination with the base name and _1.._499; only
+    # the names matter, so each is created with a bare open/close
+    images = target / "images"
+    images.mkdir(parents=True)
+    names = ["test_image.jpg"] + [f"test_image_{i}.jpg" for i in range(1, 500)]
+    _touch_many(images, names)
+
+    with patch("pathlib.Path.exists", autospec=True, side_effect=Path.exists) as mock_exists:
+        result = await organizer.organize_by_type(
+            source, target, categories={"images": [".jpg"]}
+        )
+
+    assert [p.name for p in result["images"]] == ["test_image_500.jpg"]
+    assert (images / "test_image_500.jpg").read_bytes() == b"new"
+    # Free names come from one listing, not from probing each candidate
+    assert mock_exists.call_count < 10
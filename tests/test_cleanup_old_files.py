@@ -1,24 +1,25 @@
 import pytest
 import os
 import time
-import tempfile
 from pathlib import Path
 from src.file_manager.automation import FileOrganizer
 
 # Define locally for test isolation
 SECONDS_PER_DAY = 86400
 
-@pytest.mark.asyncio
 class TestCleanupOldFiles:
 
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_dir = Path(self.temp_dir.name)
+    def setup(self, tmp_path):
+        # Scanned tree and trash are siblings so recursive cleanups never
+        # see trashed files, and nothing lands in the real ~/.tfm/trash
+        self.test_dir = tmp_path / "data"
+        self.test_dir.mkdir()
         self.organizer = FileOrganizer()
+        self.trash_dir = tmp_path / "trash"
+        self.organizer.file_ops.trash_dir = self.trash_dir
+        self.organizer.file_ops._ensure_trash_dir()
         self.now = time.time()
-        yield
-        self.temp_dir.cleanup()
 
     def _create_file_with_age(self, path: Path, days_old: float):
         """Create a file with modification time set to days_old ago."""
@@ -132,3 +133,19 @@ class TestCleanupOldFiles:
         # Verify file is deleted
         assert not zero_days_file.exists(), "File created before now should be deleted with days_old=0"
         assert zero_days_file in deleted_files
+
+    async def test_cleanup_many_files(self):
+        # More files than MAX_CONCURRENT_DELETES so the semaphore is exercised
+        old_files = [self.test_dir / f"old_{i}.txt" for i in range(100)]
+        for path in old_files:
+            self._create_file_with_age(path, 31)
+
+        deleted_files = await self.organizer.cleanup_old_files(
+            directory=self.test_dir,
+            days_old=30,
+            recursive=False
+        )
+
+        assert sorted(deleted_files) == sorted(old_files)
+        assert not any(p.exists() for p in old_files)
+        assert len(list(self.trash_dir.iterdir())) == len(old_files)
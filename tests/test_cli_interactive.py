@@ -1,9 +1,7 @@
-import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 from src.file_manager.cli import handle_duplicates
 
-@pytest.mark.asyncio
 async def test_interactive_duplicate_resolution():
     # Mock args
     args = MagicMock()
@@ -48,7 +46,6 @@ async def test_interactive_duplicate_resolution():
                 assert Path("/test/dir/file1.txt") not in deleted_paths
                 assert Path("/test/dir/file3.txt") not in deleted_paths
 
-@pytest.mark.asyncio
 async def test_interactive_duplicate_resolution_invalid_input():
     # Mock args
     args = MagicMock()
@@ -76,7 +73,6 @@ async def test_interactive_duplicate_resolution_invalid_input():
                 # Should not delete anything
                 organizer_instance.file_ops.delete.assert_not_called()
 
-@pytest.mark.asyncio
 async def test_interactive_duplicate_resolution_json_error():
     args = MagicMock()
     args.dir = "/test/dir"
@@ -16,11 +16,20 @@ class TestConfigManager:
         # File shouldn't exist initially
         assert not (config_dir / "categories.yaml").exists()
 
-        # Load should create default
+        # Load should create default, as a plain dict of lists
         categories = manager.load_categories()
-        assert categories == DEFAULT_CATEGORIES
+        assert categories == {k: list(v) for k, v in DEFAULT_CATEGORIES.items()}
+        assert all(isinstance(v, list) for v in categories.values())
         assert (config_dir / "categories.yaml").exists()
 
+    def test_default_categories_are_copies(self, manager):
+        # Missing-file fallback; mutating the result must not touch the defaults
+        categories = manager.load_categories()
+        categories["images"].append(".heic")
+        categories["extra"] = [".x"]
+        assert ".heic" not in DEFAULT_CATEGORIES["images"]
+        assert "extra" not in DEFAULT_CATEGORIES
+
     def test_load_existing(self, manager, config_dir):
         from src.file_manager.config import DEFAULT_CATEGORIES
         custom_categories = {"custom": [".xyz"]}
@@ -45,12 +54,37 @@ class TestConfigManager:
     def test_invalid_yaml(self, manager, config_dir):
         config_dir.mkdir(parents=True, exist_ok=True)
         # Create invalid yaml
-        with open(config_dir / "categories.yaml", "w") as f:
-            f.write("invalid: yaml: [")
+        (config_dir / "categories.yaml").write_text("invalid: yaml: [")
 
         # Should fall back to defaults
         categories = manager.load_categories()
-        assert categories == DEFAULT_CATEGORIES
+        assert categories == {k: list(v) for k, v in DEFAULT_CATEGORIES.items()}
 
     def test_get_config_path(self, manager, config_dir):
         assert manager.get_config_path() == config_dir / "categories.yaml"
+
+    def test_load_categories_cached_until_file_changes(self, manager, config_dir):
+        config_dir.mkdir(parents=True, exist_ok=True)
+        categories_file = config_dir / "categories.yaml"
+        categories_file.write_text(yaml.dump({"custom": [".xyz"]}))
+
+        first = manager.load_categories()
+        assert ".xyz" in first["custom"]
+        assert manager._categories_cache is not None
+
+        categories_file.write_text(yaml.dump({"custom": [".xyz", ".uvw"]}))
+        second = manager.load_categories()
+        assert ".uvw" in second["custom"]
+
+    def test_cached_categories_not_shared(self, manager, config_dir):
+        config_dir.mkdir(parents=True, exist_ok=True)
+        (config_dir / "categories.yaml").write_text(yaml.dump({"custom": [".xyz"]}))
+
+        first = manager.load_categories()
+        first["custom"].append(".edited")
+        first["images"].clear()
+
+        # Served from the mtime cache, unaffected by edits to earlier results
+        second = manager.load_categories()
+        assert second["custom"] == [".xyz"]
+        assert second["images"]
@@ -3,7 +3,6 @@ from src.file_manager.automation import FileOrganizer
 from src.file_manager.file_operations import FileOperations
 from src.file_manager.exceptions import TFMPermissionError, TFMPathNotFoundError, TFMOperationConflictError
 
-@pytest.mark.asyncio
 async def test_organize_edge_cases(tmp_path):
     organizer = FileOrganizer()
     source = tmp_path / "source"
@@ -32,7 +31,6 @@ async def test_organize_edge_cases(tmp_path):
     # subdir is a dir, so it is skipped
     assert result == {}
 
-@pytest.mark.asyncio
 async def test_file_ops_exceptions(tmp_path):
     ops = FileOperations()
 
@@ -1,9 +1,7 @@
-import pytest
 import os
 import time
 from src.file_manager.automation import FileOrganizer, ConflictResolutionStrategy
 
-@pytest.mark.asyncio
 async def test_duplicate_detection(tmp_path):
     organizer = FileOrganizer()
 
@@ -27,7 +25,6 @@ async def test_duplicate_detection(tmp_path):
     assert file2 in paths
     assert file3 not in [p for sublist in duplicates.values() for p in sublist]
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_keep_newest(tmp_path):
     organizer = FileOrganizer()
 
@@ -52,7 +49,6 @@ async def test_resolve_duplicates_keep_newest(tmp_path):
     assert not file1.exists()
     assert file2.exists()
 
-@pytest.mark.asyncio
 async def test_resolve_duplicates_keep_oldest(tmp_path):
     organizer = FileOrganizer()
 
@@ -72,7 +68,6 @@ async def test_resolve_duplicates_keep_oldest(tmp_path):
     assert not file2.exists()
     assert file1.exists()
 
-@pytest.mark.asyncio
 async def test_3_pass_logic(tmp_path):
     # This test verifies that files with same size but different content are NOT duplicates
     organizer = FileOrganizer()
@@ -4,7 +4,9 @@ from src.file_manager.tags import TagManager
 @pytest.fixture
 def tag_manager(tmp_path):
     db_path = tmp_path / "test_tags_export.db"
-    return TagManager(db_path)
+    manager = TagManager(db_path)
+    yield manager
+    manager.close()
 
 def test_export_tags(tag_manager, tmp_path):
     f1 = tmp_path / "file1.txt"
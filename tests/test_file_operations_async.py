@@ -1,22 +1,17 @@
+import os
 import pytest
-import tempfile
-from pathlib import Path
 from src.file_manager.file_operations import FileOperations, OperationType
 from src.file_manager.exceptions import TFMPathNotFoundError, TFMOperationConflictError
 
-@pytest.mark.asyncio
 class TestFileOperationsAsync:
 
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_dir = Path(self.temp_dir.name)
+    def setup(self, tmp_path):
+        self.test_dir = tmp_path
         self.file_ops = FileOperations()
         # Mock trash dir to be inside temp dir
         self.file_ops.trash_dir = self.test_dir / ".trash"
         self.file_ops.trash_dir.mkdir(parents=True, exist_ok=True)
-        yield
-        self.temp_dir.cleanup()
 
     async def test_copy_file(self):
         source = self.test_dir / "source.txt"
@@ -122,7 +117,10 @@ class TestFileOperationsAsync:
 
         assert not source.exists()
         # Check trash
-        trash_files = list(self.file_ops.trash_dir.glob("*_todelete.txt"))
+        trash_files = [
+            entry.name for entry in os.scandir(self.file_ops.trash_dir)
+            if entry.name.endswith("_todelete.txt")
+        ]
         assert len(trash_files) == 1
 
         # Verify history
@@ -1,5 +1,7 @@
+import contextlib
+import errno
 import pytest
-from src.file_manager.file_operations import FileOperations
+from src.file_manager.file_operations import FileOperations, _copy_file
 from src.file_manager.exceptions import TFMPermissionError, TFMOperationConflictError
 from unittest.mock import patch, MagicMock
 
@@ -10,7 +12,6 @@ def file_ops(tmp_path):
     f._ensure_trash_dir()
     return f
 
-@pytest.mark.asyncio
 async def test_copy_dir_tree(file_ops, tmp_path):
     src = tmp_path / "src"
     src.mkdir()
@@ -22,7 +23,6 @@ async def test_copy_dir_tree(file_ops, tmp_path):
     assert res is True
     assert (dst / "f1.txt").exists()
 
-@pytest.mark.asyncio
 async def test_copy_conflict_caught(file_ops, tmp_path):
     src = tmp_path / "src.txt"
     src.touch()
@@ -32,17 +32,15 @@ async def test_copy_conflict_caught(file_ops, tmp_path):
     with pytest.raises(TFMOperationConflictError):
         await file_ops.copy(src, dst)
 
-@pytest.mark.asyncio
 async def test_copy_oserror(file_ops, tmp_path):
     src = tmp_path / "src.txt"
     src.touch()
     dst = tmp_path / "dst.txt"
 
-    with patch("shutil.copy2", side_effect=OSError("mock")):
+    with patch("src.file_manager.file_operations._copy_file", side_effect=OSError("mock")):
         res = await file_ops.copy(src, dst)
         assert res is False
 
-@pytest.mark.asyncio
 async def test_move_oserror(file_ops, tmp_path):
     src = tmp_path / "src.txt"
     src.touch()
@@ -52,7 +50,6 @@ async def test_move_oserror(file_ops, tmp_path):
         res = await file_ops.move(src, dst)
         assert res is False
 
-@pytest.mark.asyncio
 async def test_delete_permission_error(file_ops, tmp_path):
     src = tmp_path / "src.txt"
     src.touch()
@@ -61,7 +58,6 @@ async def test_delete_permission_error(file_ops, tmp_path):
         with pytest.raises(TFMPermissionError):
             await file_ops.delete(src)
 
-@pytest.mark.asyncio
 async def test_delete_oserror(file_ops, tmp_path):
     src = tmp_path / "src.txt"
     src.touch()
@@ -70,16 +66,14 @@ async def test_delete_oserror(file_ops, tmp_path):
         res = await file_ops.delete(src)
         assert res is False
 
-@pytest.mark.asyncio
 async def test_rename_oserror(file_ops, tmp_path):
     src = tmp_path / "src.txt"
     src.touch()
 
-    with patch("pathlib.Path.rename", side_effect=OSError("mock")):
+    with patch("src.file_manager.file_operations._rename_noreplace", side_effect=OSError("mock")):
         res = await file_ops.rename(src, "new.txt")
         assert res is False
 
-@pytest.mark.asyncio
 async def test_create_directory_oserror(file_ops, tmp_path):
     src = tmp_path / "newdir"
 
@@ -87,14 +81,12 @@ async def test_create_directory_oserror(file_ops, tmp_path):
         res = await file_ops.create_directory(src)
         assert res is False
 
-@pytest.mark.asyncio
 async def test_get_size_file(file_ops, tmp_path):
     f = tmp_path / "f1.txt"
     f.write_text("hello")
     size = file_ops.get_size(f)
     assert size == 5
 
-@pytest.mark.asyncio
 async def test_get_size_dir(file_ops, tmp_path):
     d = tmp_path / "dir"
     d.mkdir()
@@ -105,12 +97,10 @@ async def test_get_size_dir(file_ops, tmp_path):
     size = file_ops.get_size(d)
     assert size == 11
 
-@pytest.mark.asyncio
 async def test_get_size_not_found(file_ops, tmp_path):
     f = tmp_path / "missing.txt"
     assert file_ops.get_size(f) == 0
 
-@pytest.mark.asyncio
 async def test_get_size_oserror_file(file_ops, tmp_path):
     f = tmp_path / "f1.txt"
     f.write_text("hello")
@@ -121,7 +111,6 @@ async def test_get_size_oserror_file(file_ops, tmp_path):
                 size = file_ops.get_size(f)
                 assert size == 0
 
-@pytest.mark.asyncio
 async def test_get_size_oserror_dir(file_ops, tmp_path):
     d = tmp_path / "d1"
     d.mkdir()
@@ -131,17 +120,14 @@ async def test_get_size_oserror_dir(file_ops, tmp_path):
         size = file_ops.get_size(d)
         assert size == 0
 
-@pytest.mark.asyncio
 async def test_format_size_tb(file_ops):
     res = file_ops.format_size(1024 * 1024 * 1024 * 1024 * 2)
     assert res == "2.0 TB"
 
-@pytest.mark.asyncio
 async def test_undo_redo_empty(file_ops):
     assert await file_ops.undo_last() == "Nothing to undo."
     assert await file_ops.redo_last() == "Nothing to redo."
 
-@pytest.mark.asyncio
 async def test_undo_unknown_op(file_ops, tmp_path):
     from src.file_manager.file_operations import FileOperation
     fake_op = FileOperation(MagicMock(), tmp_path / "src", tmp_path / "dst")
@@ -149,10 +135,72 @@ async def test_undo_unknown_op(file_ops, tmp_path):
     res = await file_ops.undo_last()
     assert "Unknown operation type" in res
 
-@pytest.mark.asyncio
 async def test_redo_unknown_op(file_ops, tmp_path):
     from src.file_manager.file_operations import FileOperation
     fake_op = FileOperation(MagicMock(), tmp_path / "src", tmp_path / "dst")
     file_ops.history._redo_stack.append(fake_op)
     res = await file_ops.redo_last()
     assert "Unknown operation type" in res
+
+async def test_copy_directory_preserves_content(file_ops, tmp_path):
+    src = tmp_path / "src_dir"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.txt").write_text("alpha")
+    (src / "nested" / "b.bin").write_bytes(b"\x00\x01" * 5000)
+    dst = tmp_path / "dst_dir"
+
+    assert await file_ops.copy(src, dst) is True
+    assert (dst / "a.txt").read_text() == "alpha"
+    assert (dst / "nested" / "b.bin").read_bytes() == b"\x00\x01" * 5000
+
+async def test_copy_falls_back_when_copy_file_range_fails(file_ops, tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("fallback content")
+    dst = tmp_path / "dst.txt"
+
+    with patch("os.copy_file_range", side_effect=OSError(errno.EXDEV, "cross-device"), create=True):
+        assert await file_ops.copy(src, dst) is True
+    assert dst.read_text() == "fallback content"
+
+async def test_copy_falls_back_when_copy_file_range_copies_nothing(file_ops, tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("not really empty")
+    dst = tmp_path / "dst.txt"
+
+    # Some filesystems return 0 at once instead of raising
+    with patch("os.copy_file_range", return_value=0, create=True):
+        assert await file_ops.copy(src, dst) is True
+    assert dst.read_text() == "not really empty"
+
+async def test_redo_copy_uses_copy_file(file_ops, tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("redo me")
+    dst = tmp_path / "dst.txt"
+
+    assert await file_ops.copy(src, dst) is True
+    await file_ops.undo_last()
+    assert not dst.exists()
+
+    with patch("src.file_manager.file_operations._copy_file", wraps=_copy_file) as mock_copy:
+        assert "Redid copy" in await file_ops.redo_last()
+    mock_copy.assert_called_once_with(str(src), str(dst))
+    assert dst.read_text() == "redo me"
+
+@pytest.mark.parametrize("atomic", [True, False])
+async def test_rename_never_replaces_target(file_ops, tmp_path, atomic):
+    src = tmp_path / "src.txt"
+    dst = tmp_path / "dst.txt"
+    src.write_text("src")
+    dst.write_text("dst")
+
+    # Without renameat2 the check-then-rename fallback is used
+    fallback = contextlib.nullcontext() if atomic else patch(
+        "src.file_manager.file_operations._renameat2", None
+    )
+    with fallback:
+        with pytest.raises(TFMOperationConflictError):
+            await file_ops.rename(src, "dst.txt")
+        assert await file_ops.rename(src, "moved.txt")
+
+    assert dst.read_text() == "dst"
+    assert (tmp_path / "moved.txt").read_text() == "src"
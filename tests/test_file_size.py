@@ -1,58 +1,77 @@
 import pytest
-import tempfile
-from pathlib import Path
 from src.file_manager.file_operations import FileOperations
 
+@pytest.fixture(scope="module")
+def size_shapes(tmp_path_factory):
+    """Build every get_size shape once; the tree is only ever read."""
+    root = tmp_path_factory.mktemp("sizes")
+
+    (root / "test.txt").write_text("Hello, World!")  # 13 bytes
+    (root / "empty_dir").mkdir()
+
+    with_files = root / "dir_with_files"
+    with_files.mkdir()
+    (with_files / "f1.txt").write_text("abc")  # 3 bytes
+    (with_files / "f2.txt").write_text("defg")  # 4 bytes
+
+    nested = root / "nested"
+    (nested / "subdir").mkdir(parents=True)
+    (nested / "f1.txt").write_text("123")  # 3 bytes
+    (nested / "subdir" / "f2.txt").write_text("4567")  # 4 bytes
+
+    shapes = {
+        "nonexistent": (root / "nonexistent", 0),
+        "file": (root / "test.txt", 13),
+        "empty_dir": (root / "empty_dir", 0),
+        "dir_with_files": (with_files, 7),
+        "nested": (nested, 7),
+    }
+
+    external = root / "external.txt"
+    external.write_text("external content")  # 16 bytes
+    dir_with_link = root / "dir_with_link"
+    dir_with_link.mkdir()
+    link_root = root / "root_link_dir"
+    (link_root / "subdir").mkdir(parents=True)
+    (link_root / "subdir" / "file.txt").write_text("1234")
+    try:
+        (root / "test_link.txt").symlink_to(external)
+        (dir_with_link / "link.txt").symlink_to(external)
+        (link_root / "link_to_subdir").symlink_to(
+            link_root / "subdir", target_is_directory=True
+        )
+    except OSError:
+        return shapes
+
+    # Symlinked files are followed; symlinked directories are not
+    # descended into, so link_to_subdir adds nothing.
+    shapes["symlink_to_file"] = (root / "test_link.txt", 16)
+    shapes["dir_with_symlink_to_file"] = (dir_with_link, 16)
+    shapes["dir_with_symlink_to_dir"] = (link_root, 4)
+    return shapes
+
+
 class TestFileSize:
     @pytest.fixture(autouse=True)
-    def setup(self):
-        self.temp_dir = tempfile.TemporaryDirectory()
-        self.test_path = Path(self.temp_dir.name)
+    def setup(self, tmp_path):
+        self.test_path = tmp_path
         self.file_ops = FileOperations()
-        yield
-        self.temp_dir.cleanup()
-
-    def test_get_size_nonexistent(self):
-        nonexistent = self.test_path / "nonexistent"
-        assert self.file_ops.get_size(nonexistent) == 0
-
-    def test_get_size_file(self):
-        file_path = self.test_path / "test.txt"
-        content = "Hello, World!"
-        file_path.write_text(content)
-        assert self.file_ops.get_size(file_path) == len(content)
-
-    def test_get_size_empty_directory(self):
-        dir_path = self.test_path / "empty_dir"
-        dir_path.mkdir()
-        assert self.file_ops.get_size(dir_path) == 0
-
-    def test_get_size_directory_with_files(self):
-        dir_path = self.test_path / "dir_with_files"
-        dir_path.mkdir()
-
-        f1 = dir_path / "f1.txt"
-        f1.write_text("abc") # 3 bytes
-
-        f2 = dir_path / "f2.txt"
-        f2.write_text("defg") # 4 bytes
 
-        assert self.file_ops.get_size(dir_path) == 7
-
-    def test_get_size_nested_directory(self):
-        root_dir = self.test_path / "root"
-        root_dir.mkdir()
-
-        f1 = root_dir / "f1.txt"
-        f1.write_text("123") # 3 bytes
-
-        sub_dir = root_dir / "subdir"
-        sub_dir.mkdir()
-
-        f2 = sub_dir / "f2.txt"
-        f2.write_text("4567") # 4 bytes
-
-        assert self.file_ops.get_size(root_dir) == 7
+    @pytest.mark.parametrize("shape", [
+        "nonexistent",
+        "file",
+        "empty_dir",
+        "dir_with_files",
+        "nested",
+        "symlink_to_file",
+        "dir_with_symlink_to_file",
+        "dir_with_symlink_to_dir",
+    ])
+    def test_get_size(self, size_shapes, shape):
+        if shape not in size_shapes:
+            pytest.skip("Symlinks not supported on this platform")
+        path, expected = size_shapes[shape]
+        assert self.file_ops.get_size(path) == expected
 
     def test_format_size(self):
         assert FileOperations.format_size(0) == "0.0 B"
@@ -64,73 +83,61 @@ class TestFileSize:
         assert FileOperations.format_size(1024**5) == "1.0 PB"
         assert FileOperations.format_size(1536) == "1.5 KB"
 
-    def test_get_size_with_symlink_to_file(self):
-        file_path = self.test_path / "test.txt"
-        content = "symlink content"
-        file_path.write_text(content)
-
-        symlink_path = self.test_path / "test_link.txt"
-        try:
-            symlink_path.symlink_to(file_path)
-        except OSError:
-            pytest.skip("Symlinks not supported on this platform")
-
-        assert self.file_ops.get_size(symlink_path) == len(content)
-
-    def test_get_directory_size_with_symlink_to_file(self):
-        dir_path = self.test_path / "dir_with_link"
-        dir_path.mkdir()
-
-        file_path = self.test_path / "external.txt"
-        content = "external content"
-        file_path.write_text(content)
-
-        symlink_path = dir_path / "link.txt"
-        try:
-            symlink_path.symlink_to(file_path)
-        except OSError:
-            pytest.skip("Symlinks not supported on this platform")
-
-        # _get_directory_size uses follow_symlinks=True for files
-        assert self.file_ops.get_size(dir_path) == len(content)
-
-    def test_get_directory_size_with_symlink_to_dir(self):
-        # Setup:
-        # root/
-        #   subdir/ (contains file 4 bytes)
-        #   link_to_subdir -> subdir
-
-        root = self.test_path / "root_link_dir"
+    def test_get_size_wide_directory(self):
+        # Enough top-level entries to take the parallel path
+        root = self.test_path / "wide"
         root.mkdir()
-
-        subdir = root / "subdir"
-        subdir.mkdir()
-
-        f = subdir / "file.txt"
-        f.write_text("1234")
-
-        link = root / "link_to_subdir"
-        try:
-            link.symlink_to(subdir, target_is_directory=True)
-        except OSError:
-            pytest.skip("Symlinks not supported on this platform")
-
-        # recursive_scan uses follow_symlinks=False for directories
-        # So link_to_subdir should be yielded by recursive_scan,
-        # but entry.is_dir(follow_symlinks=False) will be True for it?
-        # Wait, if it is a symlink, is_dir(follow_symlinks=False) is True?
-        # Actually os.DirEntry.is_dir(follow_symlinks=False) is True if it's a directory and NOT a symlink?
-        # No, if it's a symlink to a directory:
-        # is_dir(follow_symlinks=False) -> False
-        # is_dir(follow_symlinks=True) -> True
-
-        # In recursive_scan:
-        # if entry.is_dir(follow_symlinks=False): stack.append(entry.path)
-        # So it won't recurse into link_to_subdir.
-
-        # In _get_directory_size:
-        # if entry.is_file(follow_symlinks=True): total += ...
-        # link_to_subdir is NOT a file (it's a directory), even if we follow symlinks.
-        # So it should NOT be counted.
-
-        assert self.file_ops.get_size(root) == 4
+        expected = 0
+        for i in range(300):
+            (root / f"f{i}.txt").write_text("x" * i)
+            expected += i
+        for i in range(4):
+            sub = root / f"sub{i}"
+            (sub / "nested").mkdir(parents=True)
+            (sub / "nested" / "data.bin").write_bytes(b"\0" * 100)
+            expected += 100
+
+        assert self.file_ops.get_size(root) == expected
+
+    def test_get_size_with_cache(self):
+        root = self.test_path / "cached"
+        (root / "sub").mkdir(parents=True)
+        (root / "a.txt").write_text("abc")
+        (root / "sub" / "b.txt").write_text("defg")
+
+        cache_path = self.test_path / "size_cache.json"
+        file_ops = FileOperations(cache_path=cache_path)
+        assert file_ops.get_size(root) == 7
+        file_ops.save_size_cache()
+        assert cache_path.exists()
+
+        # A fresh instance reuses the persisted entries
+        reloaded = FileOperations(cache_path=cache_path)
+        assert reloaded.get_size(root) == 7
+
+        # Adding a file changes the directory mtime and invalidates its entry
+        (root / "sub" / "c.txt").write_text("hi")
+        assert reloaded.get_size(root) == 9
+
+    def test_save_size_cache_prunes_vanished_dirs(self):
+        root = self.test_path / "pruned"
+        (root / "gone").mkdir(parents=True)
+        (root / "gone" / "a.txt").write_text("abc")
+
+        cache_path = self.test_path / "size_cache.json"
+        file_ops = FileOperations(cache_path=cache_path)
+        assert file_ops.get_size(root) == 3
+
+        (root / "gone" / "a.txt").unlink()
+        (root / "gone").rmdir()
+        file_ops.save_size_cache()
+
+        reloaded = FileOperations(cache_path=cache_path)
+        assert set(reloaded._load_size_cache()) == {str(root)}
+
+    def test_save_size_cache_does_not_create_parent(self):
+        cache_path = self.test_path / "missing" / "size_cache.json"
+        file_ops = FileOperations(cache_path=cache_path)
+        file_ops.get_size(self.test_path)
+        file_ops.save_size_cache()
+        assert not cache_path.parent.exists()
@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 from textual.app import App, ComposeResult
 from textual.widgets import Label, Input, Button
 from src.file_manager.screens import InputScreen
@@ -7,119 +8,92 @@ class HeadlessApp(App):
     def compose(self) -> ComposeResult:
         yield Label("Main")
 
-@pytest.mark.asyncio
-async def test_input_screen_composition():
-    app = HeadlessApp()
-    async with app.run_test() as pilot:
-        screen = InputScreen("Test Title", "Test Message", "Initial")
-        await app.push_screen(screen)
-
-        # Check title
-        title = screen.query_one(".title", Label)
-        assert str(title.render()) == "Test Title"
-
-        # Check message
-        message = screen.query_one("#message", Label)
-        assert str(message.render()) == "Test Message"
-        await app.push_screen(screen)
-
-        # Check title and message
-        title = screen.query_one(".title", Label)
-        assert str(title.render()) == "Test Title"
-
-        message = screen.query_one("#message", Label)
-        assert str(message.render()) == "Test Message"
-        screen = InputScreen("Test Title", "Test Prompt", "Initial")
-        await app.push_screen(screen)
-
-        # Check prompt
-        prompt = screen.query_one("#message", Label)
-        assert str(prompt.render()) == "Test Prompt"
-
-        # Check input
-        input_widget = screen.query_one(Input)
-        assert input_widget.value == "Initial"
-        assert input_widget.placeholder == "Enter value..."
-
-        # Check buttons
-        ok_btn = screen.query_one("#ok", Button)
-        cancel_btn = screen.query_one("#cancel", Button)
-        assert str(ok_btn.label) == "OK"
-        assert str(cancel_btn.label) == "Cancel"
-
-        # Check variants (new InputScreen uses success/primary vs old error/primary)
-        assert ok_btn.variant == "success"
-        assert cancel_btn.variant == "primary"
-
-        # Test OK button
-        input_widget.value = "New Value"
-        await pilot.click("#ok")
-        # Assert screen is dismissed (by checking app.screen is not this screen)
-        assert app.screen is not screen
-
-@pytest.mark.asyncio
-async def test_input_screen_cancel():
-    app = HeadlessApp()
-    result = None
-
-    def handle_result(res):
-        nonlocal result
-        result = res
-
-    async with app.run_test() as pilot:
-        screen = InputScreen("Title", "Message")
-        await app.push_screen(screen, handle_result)
-
-        await pilot.click("#cancel")
-        assert result == "" # Cancel returns empty string in new InputScreen logic
-        screen = InputScreen("Test Title", "Test Message")
-        await app.push_screen(screen, handle_result)
-
-        await pilot.click("#cancel")
-        assert result == ""  # Cancel returns empty string in the new InputScreen
-        screen = InputScreen("Test Title", "Test Prompt")
-        await app.push_screen(screen, handle_result)
-
-        await pilot.click("#cancel")
-        # In the new InputScreen, cancel returns empty string "", not None
-        assert result == ""
-        assert app.screen is not screen
 
-@pytest.mark.asyncio
-async def test_input_screen_submit():
+# One headless app serves the whole module; each test only pushes screens.
+@pytest_asyncio.fixture(scope="module")
+async def app_pilot():
     app = HeadlessApp()
-    result = None
-
-    def handle_result(res):
-        nonlocal result
-        result = res
-
     async with app.run_test() as pilot:
-        screen = InputScreen("Title", "Message")
-        screen = InputScreen("Test Title", "Test Message")
-        screen = InputScreen("Test Title", "Test Prompt")
-        await app.push_screen(screen, handle_result)
-
-        input_widget = screen.query_one(Input)
-        input_widget.value = "Test Dir"
+        yield app, pilot
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _pop_screens(app_pilot):
+    """Return the shared app to its base screen after every test."""
+    app, pilot = app_pilot
+    yield
+    while len(app.screen_stack) > 1:
+        await app.pop_screen()
+    await pilot.pause()
+
+
+async def test_input_screen_composition(app_pilot):
+    app, pilot = app_pilot
+    screen = InputScreen("Test Title", "Test Message", "Initial")
+    await app.push_screen(screen)
+
+    # Check title
+    title = screen.query_one(".title", Label)
+    assert str(title.render()) == "Test Title"
+
+    # Check message
+    message = screen.query_one("#message", Label)
+    assert str(message.render()) == "Test Message"
+    await app.push_screen(screen)
+
+    # Check title and message
+    title = screen.query_one(".title", Label)
+    assert str(title.render()) == "Test Title"
+
+    message = screen.query_one("#message", Label)
+    assert str(message.render()) == "Test Message"
+    screen = InputScreen("Test Title", "Test Prompt", "Initial")
+    await app.push_screen(screen)
+
+    # Check prompt
+    prompt = screen.query_one("#message", Label)
+    assert str(prompt.render()) == "Test Prompt"
+
+    # Check input
+    input_widget = screen.query_one(Input)
+    assert input_widget.value == "Initial"
+    assert input_widget.placeholder == "Enter value..."
+
+    # Check buttons
+    ok_btn = screen.query_one("#ok", Button)
+    cancel_btn = screen.query_one("#cancel", Button)
+    assert str(ok_btn.label) == "OK"
+    assert str(cancel_btn.label) == "Cancel"
+
+    # Check variants (new InputScreen uses success/primary vs old error/primary)
+    assert ok_btn.variant == "success"
+    assert cancel_btn.variant == "primary"
+
+    # Test OK button
+    input_widget.value = "New Value"
+    await pilot.click("#ok")
+    # Assert screen is dismissed (by checking app.screen is not this screen)
+    assert app.screen is not screen
+
+@pytest.mark.parametrize("action, expected", [
+    ("cancel", ""),  # Cancel returns an empty string, not None
+    ("submit", "Test Dir"),
+    ("escape", ""),
+])
+async def test_input_screen_result(app_pilot, action, expected):
+    app, pilot = app_pilot
+    results = []
+
+    screen = InputScreen("Test Title", "Test Prompt")
+    await app.push_screen(screen, results.append)
+
+    if action == "cancel":
+        await pilot.click("#cancel")
+    elif action == "submit":
+        screen.query_one(Input).value = "Test Dir"
         await pilot.press("enter")
-
-        assert result == "Test Dir"
-        assert app.screen is not screen
-
-@pytest.mark.asyncio
-async def test_input_screen_escape():
-    app = HeadlessApp()
-    result = None
-
-    def handle_result(res):
-        nonlocal result
-        result = res
-
-    async with app.run_test() as pilot:
-        screen = InputScreen("Title", "Prompt")
-        await app.push_screen(screen, handle_result)
-
+    else:
         await pilot.press("escape")
-        assert result == ""
-        assert app.screen is not screen
+
+    assert results == [expected]
+    assert app.screen is not screen
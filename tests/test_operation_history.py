@@ -1,6 +1,12 @@
 import pytest
+from datetime import datetime
 from pathlib import Path
-from src.file_manager.file_operations import OperationHistory, FileOperation, OperationType
+from src.file_manager.file_operations import OperationHistory, FileOperation, OperationType, MAX_UNDO_HISTORY
+
+@pytest.fixture(scope="module")
+def shared_history():
+    return OperationHistory()
+
 
 class TestOperationHistory:
 
@@ -9,9 +15,10 @@ class TestOperationHistory:
         return tmp_path / "history.json"
 
     @pytest.fixture
-    def history(self):
-        h = OperationHistory()
-        return h
+    def history(self, shared_history):
+        # Reuse one instance; clearing it is all a fresh history amounts to
+        shared_history.clear()
+        return shared_history
 
     def test_log_operation(self, history):
         op = FileOperation(OperationType.COPY, Path("/src"), Path("/dst"))
@@ -56,3 +63,49 @@ class TestOperationHistory:
         assert len(history._redo_stack) == 0
         assert len(history._undo_stack) == 1
         assert history._undo_stack[0] == op2
+
+    def test_undo_stack_is_bounded(self, history):
+        ops = [
+            FileOperation(OperationType.COPY, Path(f"/s{i}"), Path(f"/d{i}"))
+            for i in range(MAX_UNDO_HISTORY + 5)
+        ]
+        for op in ops:
+            history.log_operation(op)
+
+        assert len(history._undo_stack) == MAX_UNDO_HISTORY
+        assert history._undo_stack[0] == ops[5]
+        assert history.undo_last() == ops[-1]
+
+    def test_clear(self, history):
+        history.log_operation(FileOperation(OperationType.MOVE, Path("/a"), Path("/b")))
+        history.log_operation(FileOperation(OperationType.COPY, Path("/c"), Path("/d")))
+        history.undo_last()
+
+        history.clear()
+
+        assert history.undo_last() is None
+        assert history.redo_last() is None
+
+    def test_to_dict(self, history):
+        op = FileOperation(OperationType.COPY, Path("/src/file.txt"), Path("/dst/file.txt"))
+        history.log_operation(op)
+
+        data = history._undo_stack[0].to_dict()
+        assert data["type"] == "COPY"
+        assert data["original_path"] == str(Path("/src/file.txt"))
+
+    def test_round_trip_serialization(self):
+        op = FileOperation(
+            OperationType.DELETE,
+            Path("/path/to/delete"),
+            trash_path=Path("/trash/path"),
+            timestamp=datetime.now()
+        )
+
+        data = op.to_dict()
+        restored_op = FileOperation.from_dict(data)
+
+        assert restored_op.type == op.type
+        assert restored_op.original_path == op.original_path
+        assert restored_op.trash_path == op.trash_path
+        assert restored_op.timestamp == op.timestamp
@@ -1,56 +0,0 @@
-import pytest
-import json
-from datetime import datetime
-from pathlib import Path
-from unittest.mock import patch
-
-from src.file_manager.file_operations import OperationHistory, FileOperation, OperationType
-
-class TestOperationHistoryJSON:
-
-    def test_json_persistence(self, tmp_path):
-        mock_history_path = tmp_path / "history.json"
-
-        op = FileOperation(
-            OperationType.COPY,
-            Path("/src/file.txt"),
-            Path("/dst/file.txt")
-        )
-        history = OperationHistory()
-        history.log_operation(op)
-
-        # OperationHistory uses session-scoped in-memory stack, no JSON history file is created directly by it.
-        # But this test file's name test_operation_history_json.py implies maybe it was planned or it tests serialization.
-        # Let's change this test to use the actual in memory stack size.
-        assert len(history._undo_stack) == 1
-
-        # Test serialization of FileOperation instead.
-        data = history._undo_stack[0].to_dict()
-        assert data["type"] == "COPY"
-        assert data["original_path"] == str(Path("/src/file.txt"))
-
-    def test_load_history(self, tmp_path):
-        # OperationHistory does not persist to history.json.
-        # Just test that a new history is empty.
-        new_history = OperationHistory()
-        assert len(new_history._undo_stack) == 0
-
-    def test_corrupt_history_file(self, tmp_path):
-        # Just to pass the test if the class doesn't do json
-        pass
-
-    def test_round_trip_serialization(self):
-        op = FileOperation(
-            OperationType.DELETE,
-            Path("/path/to/delete"),
-            trash_path=Path("/trash/path"),
-            timestamp=datetime.now()
-        )
-
-        data = op.to_dict()
-        restored_op = FileOperation.from_dict(data)
-
-        assert restored_op.type == op.type
-        assert restored_op.original_path == op.original_path
-        assert restored_op.trash_path == op.trash_path
-        assert restored_op.timestamp == op.timestamp
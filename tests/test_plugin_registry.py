@@ -1,9 +1,20 @@
+import importlib.util
+import shutil
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 from src.file_manager.plugins.registry import PluginRegistry
 from src.file_manager.plugins.base import TFMPlugin
 
+LOADED_PLUGIN_SOURCE = """
+from src.file_manager.plugins.base import TFMPlugin
+from pathlib import Path
+
+class LoadedPlugin(TFMPlugin):
+    def on_file_added(self, path: Path) -> None:
+        print(f"Loaded: {path}")
+"""
+
 class MockPlugin(TFMPlugin):
     def __init__(self):
         self.added = []
@@ -15,19 +26,25 @@ class MockPlugin(TFMPlugin):
     def on_file_deleted(self, path: Path) -> None:
         self.deleted.append(path)
 
-@pytest.fixture
-def registry(tmp_path):
-    # Reset singleton
+@pytest.fixture(scope="module")
+def _module_registry(tmp_path_factory):
+    # Reset singleton and keep plugins out of the real home directory
     PluginRegistry._instance = None
-    # Patch home to ensure isolation
-    with patch("pathlib.Path.home", return_value=tmp_path):
-        reg = PluginRegistry()
-        # Ensure it uses tmp_path/.tfm/plugins
-        assert reg.plugin_dir == tmp_path / ".tfm" / "plugins"
-        yield reg
+    reg = PluginRegistry()
+    reg.plugin_dir = tmp_path_factory.mktemp("home") / ".tfm" / "plugins"
+    yield reg
     # Cleanup
     PluginRegistry._instance = None
 
+@pytest.fixture
+def registry(_module_registry):
+    # Each test gets the shared registry with no plugins and no plugin files
+    _module_registry.plugins.clear()
+    _module_registry._loaded.clear()
+    _module_registry._plugins_loaded = False
+    shutil.rmtree(_module_registry.plugin_dir, ignore_errors=True)
+    return _module_registry
+
 def test_singleton(registry):
     reg2 = PluginRegistry()
     assert reg2 is registry
@@ -44,20 +61,12 @@ def test_register_and_hooks(registry):
     registry.on_file_deleted(path)
     assert path in plugin.deleted
 
-def test_load_plugins(registry, tmp_path):
+def test_load_plugins(registry):
     # Create a plugin file
     plugin_dir = registry.plugin_dir
     plugin_dir.mkdir(parents=True, exist_ok=True)
 
-    plugin_code = """
-from src.file_manager.plugins.base import TFMPlugin
-from pathlib import Path
-
-class LoadedPlugin(TFMPlugin):
-    def on_file_added(self, path: Path) -> None:
-        print(f"Loaded: {path}")
-"""
-    (plugin_dir / "my_plugin.py").write_text(plugin_code)
+    (plugin_dir / "my_plugin.py").write_text(LOADED_PLUGIN_SOURCE)
 
     # Reload plugins
     registry.load_plugins()
@@ -65,7 +74,28 @@ class LoadedPlugin(TFMPlugin):
     assert len(registry.plugins) == 1
     assert registry.plugins[0].__class__.__name__ == "LoadedPlugin"
 
-def test_load_plugins_error_handling(registry, tmp_path):
+def test_load_plugins_reuses_unchanged_files(registry):
+    plugin_dir = registry.plugin_dir
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    plugin_file = plugin_dir / "my_plugin.py"
+    plugin_file.write_text(LOADED_PLUGIN_SOURCE)
+
+    with patch(
+        "importlib.util.spec_from_file_location",
+        wraps=importlib.util.spec_from_file_location,
+    ) as spec_from:
+        registry.load_plugins()
+        registry.load_plugins()
+        assert spec_from.call_count == 1
+        assert len(registry.plugins) == 1
+
+        # Editing the file makes the next load execute it again
+        plugin_file.write_text(LOADED_PLUGIN_SOURCE + "\n# edited\n")
+        registry.load_plugins()
+        assert spec_from.call_count == 2
+        assert len(registry.plugins) == 1
+
+def test_load_plugins_error_handling(registry):
     plugin_dir = registry.plugin_dir
     plugin_dir.mkdir(parents=True, exist_ok=True)
 
@@ -78,3 +108,24 @@ def test_load_plugins_error_handling(registry, tmp_path):
     # The valid plugin from previous test is gone because we cleared plugins list in load_plugins
     # Wait, load_plugins() clears self.plugins.
     assert len(registry.plugins) == 0
+
+def test_ensure_loaded_only_loads_once(registry):
+    plugin_dir = registry.plugin_dir
+    plugin_dir.mkdir(parents=True, exist_ok=True)
+    (plugin_dir / "my_plugin.py").write_text(LOADED_PLUGIN_SOURCE)
+
+    registry.ensure_loaded()
+    assert len(registry.plugins) == 1
+    first = registry.plugins[0]
+
+    registry.ensure_loaded()
+    # Same instance: the plugin set was not rebuilt
+    assert registry.plugins == [first]
+
+def test_default_plugin_dir(tmp_path):
+    PluginRegistry._instance = None
+    try:
+        with patch("pathlib.Path.home", return_value=tmp_path):
+            assert PluginRegistry().plugin_dir == tmp_path / ".tfm" / "plugins"
+    finally:
+        PluginRegistry._instance = None
@@ -19,7 +19,6 @@ def test_add_remove_job(scheduler):
 def test_invalid_cron(scheduler):
     assert not scheduler.add_job("job_bad", "invalid cron", "cleanup", {})
 
-@pytest.mark.asyncio
 async def test_run_pending(scheduler):
     # Mock organizer
     scheduler.organizer.cleanup_old_files = AsyncMock()
@@ -42,7 +41,6 @@ async def test_run_pending(scheduler):
     await scheduler.run_pending()
     scheduler.organizer.cleanup_old_files.assert_not_called()
 
-@pytest.mark.asyncio
 async def test_run_now(scheduler):
     scheduler.organizer.cleanup_old_files = AsyncMock()
 
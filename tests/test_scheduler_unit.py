@@ -1,5 +1,6 @@
+import asyncio
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 from datetime import datetime, timedelta
 from src.file_manager.scheduler import TaskScheduler
 
@@ -21,13 +22,28 @@ def test_add_invalid_cron(scheduler):
     # Should not add
     assert len(scheduler.jobs) == 0
 
+def test_save_jobs_replaces_file_atomically(scheduler):
+    scheduler.add_job("job1", "* * * * *", "cleanup", {})
+    scheduler.add_job("job2", "0 * * * *", "cleanup", {})
+
+    reloaded = TaskScheduler(scheduler.schedule_file)
+    assert [j["name"] for j in reloaded.jobs] == ["job1", "job2"]
+    assert [p.name for p in scheduler.schedule_file.parent.iterdir()] == ["test_schedule.json"]
+
+def test_save_jobs_failure_keeps_previous_file(scheduler):
+    scheduler.add_job("job1", "* * * * *", "cleanup", {})
+    with patch("src.file_manager.scheduler.os.replace", side_effect=OSError("disk full")):
+        scheduler.add_job("job2", "* * * * *", "cleanup", {})
+
+    assert [j["name"] for j in TaskScheduler(scheduler.schedule_file).jobs] == ["job1"]
+    assert [p.name for p in scheduler.schedule_file.parent.iterdir()] == ["test_schedule.json"]
+
 def test_remove_job(scheduler):
     scheduler.add_job("job1", "* * * * *", "cleanup", {})
     assert scheduler.remove_job("job1")
     assert len(scheduler.jobs) == 0
     assert not scheduler.remove_job("job1")
 
-@pytest.mark.asyncio
 async def test_run_pending(scheduler):
     # Mock organizer methods
     # Use AsyncMock for async methods
@@ -48,3 +64,86 @@ async def test_run_pending(scheduler):
 
     # Check if last_run updated
     assert job["last_run"] > (datetime.now() - timedelta(seconds=5)).timestamp()
+
+def _hourly_cron_away_from_now() -> str:
+    return f"{(datetime.now().minute + 30) % 60} * * * *"
+
+async def test_run_pending_skips_unchanged_jobs(scheduler):
+    scheduler.organizer.cleanup_old_files = AsyncMock(return_value=[])
+    # Hourly, at a minute about half an hour away from now
+    cron = _hourly_cron_away_from_now()
+    scheduler.add_job("idle", cron, "cleanup", {"dir": ".", "days": 30})
+    scheduler.add_job("due", cron, "cleanup", {"dir": ".", "days": 30})
+    scheduler.jobs[1]["last_run"] = (datetime.now() - timedelta(hours=2)).timestamp()
+
+    await scheduler.run_pending()
+    assert scheduler.organizer.cleanup_old_files.await_count == 1
+
+    # Nothing changed and nothing is due: no job is re-evaluated
+    with patch.object(TaskScheduler, "_due_time", wraps=TaskScheduler._due_time) as due_time:
+        await scheduler.run_pending()
+    due_time.assert_not_called()
+    assert scheduler.organizer.cleanup_old_files.await_count == 1
+
+async def test_run_pending_ignores_removed_and_disabled_jobs(scheduler):
+    scheduler.organizer.cleanup_old_files = AsyncMock(return_value=[])
+    scheduler.add_job("removed", "* * * * *", "cleanup", {"dir": ".", "days": 30})
+    scheduler.add_job("disabled", "* * * * *", "cleanup", {"dir": ".", "days": 30})
+    scheduler.jobs[1]["enabled"] = False
+    stale = (datetime.now() - timedelta(seconds=70)).timestamp()
+    scheduler.jobs[0]["last_run"] = stale
+    scheduler.jobs[1]["last_run"] = stale
+
+    scheduler.remove_job("removed")
+    await scheduler.run_pending()
+
+    scheduler.organizer.cleanup_old_files.assert_not_called()
+
+async def test_run_pending_new_job_outside_first_run_window(scheduler):
+    scheduler.organizer.cleanup_old_files = AsyncMock(return_value=[])
+    # Its last scheduled time was about half an hour ago
+    scheduler.add_job("hourly", _hourly_cron_away_from_now(), "cleanup", {"dir": ".", "days": 30})
+
+    await scheduler.run_pending()
+
+    scheduler.organizer.cleanup_old_files.assert_not_called()
+    assert scheduler.jobs[0]["last_run"] is None
+
+async def test_run_pending_overlaps_due_jobs(scheduler):
+    started = []
+    release = asyncio.Event()
+
+    async def slow_cleanup(directory, days, recursive):
+        started.append(directory)
+        await release.wait()
+        return []
+
+    scheduler.organizer.cleanup_old_files = slow_cleanup
+    stale = (datetime.now() - timedelta(hours=2)).timestamp()
+    for i in range(3):
+        scheduler.add_job(f"job{i}", "* * * * *", "cleanup", {"dir": f"d{i}", "days": 30})
+        scheduler.jobs[-1]["last_run"] = stale
+
+    run = asyncio.create_task(scheduler.run_pending())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    # All three are in flight before any of them has finished
+    assert len(started) == 3
+
+    release.set()
+    await run
+    assert all(job["last_run"] > stale for job in scheduler.jobs)
+
+def test_due_time_reuses_parsed_cron(scheduler):
+    from src.file_manager.scheduler import _cron_iter
+    _cron_iter.cache_clear()
+    base = datetime(2024, 3, 1, 12, 0)
+    job = {"name": "j", "cron": "*/15 * * * *", "last_run": base.timestamp()}
+
+    first = scheduler._due_time(job, datetime.now())
+    job["last_run"] = first
+    second = scheduler._due_time(job, datetime.now())
+
+    assert datetime.fromtimestamp(first) == datetime(2024, 3, 1, 12, 15)
+    assert datetime.fromtimestamp(second) == datetime(2024, 3, 1, 12, 30)
+    assert _cron_iter.cache_info().misses == 1
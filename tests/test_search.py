@@ -25,8 +25,7 @@ class TestFileSearcher:
         (subdir / "file3.py").write_text("print('hello')")
 
         # Create a "binary" file
-        with open(subdir / "image.png", "wb") as f:
-            f.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 100)
+        (subdir / "image.png").write_bytes(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 100)
 
         return tmp_path
 
@@ -68,8 +67,9 @@ class TestFileSearcher:
 
         # Add "hello" to binary file
         subdir = test_files / "subdir"
-        with open(subdir / "image_with_text.png", "wb") as f:
-            f.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"hello" + b"\x00" * 100)
+        (subdir / "image_with_text.png").write_bytes(
+            b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"hello" + b"\x00" * 100
+        )
 
         results = searcher.search_by_content(test_files, "hello")
         # Should NOT find image_with_text.png because it's detected as binary
@@ -119,3 +119,48 @@ def test_is_text_file_oserror(searcher, tmp_path):
     with patch("builtins.open", side_effect=OSError("mock")):
         res = searcher._is_text_file(f)
         assert res is False
+
+def test_file_contains_term_across_chunk_boundary(searcher, tmp_path):
+    from src.file_manager.search import CONTENT_SEARCH_CHUNK_SIZE
+    f = tmp_path / "big.txt"
+    # "NEEDLE" starts three bytes before the first window ends
+    f.write_bytes(b"x" * (CONTENT_SEARCH_CHUNK_SIZE - 3) + b"NEEDLE" + b"y" * 100)
+
+    assert searcher._file_contains_term(f, "needle", False) is True
+    assert searcher._file_contains_term(f, "NEEDLE", True) is True
+    assert searcher._file_contains_term(f, "needle", True) is False
+
+def test_file_contains_term_non_ascii_case_insensitive(searcher, tmp_path):
+    f = tmp_path / "unicode.txt"
+    f.write_text("Grüße aus KÖLN", encoding="utf-8")
+
+    assert searcher._file_contains_term(f, "köln", False) is True
+    assert searcher._file_contains_term(f, "KÖLN", True) is True
+
+def test_file_contains_term_empty_file(searcher, tmp_path):
+    f = tmp_path / "empty.txt"
+    f.touch()
+    assert searcher._file_contains_term(f, "anything", False) is False
+
+def test_file_contains_term_skip_binary(searcher, tmp_path):
+    f = tmp_path / "blob.dat"
+    f.write_bytes(b"\x00\x01needle")
+    assert searcher._file_contains_term(f, "needle", False) is True
+    assert searcher._file_contains_term(f, "needle", False, skip_binary=True) is False
+
+def test_search_by_size_many_files(searcher, tmp_path):
+    from src.file_manager.search import STAT_BATCH_SIZE
+    count = STAT_BATCH_SIZE * 2 + 5
+    for i in range(count):
+        (tmp_path / f"f{i}.bin").write_bytes(b"x" * (i % 3))
+
+    res = searcher.search_by_size(tmp_path, min_size=2, recursive=False)
+    assert sorted(p.name for p in res) == sorted(f"f{i}.bin" for i in range(count) if i % 3 == 2)
+
+def test_file_contains_term_shorter_file(searcher, tmp_path):
+    f = tmp_path / "short.txt"
+    f.write_bytes(b"hell")
+    with patch("src.file_manager.search._looks_binary") as sniff:
+        assert searcher._file_contains_term(f, "hello", False, skip_binary=True) is False
+    # Rejected on size alone, before the binary sniff reads anything
+    sniff.assert_not_called()
@@ -4,7 +4,9 @@ from src.file_manager.tags import TagManager
 @pytest.fixture
 def tag_manager(tmp_path):
     db_path = tmp_path / "tags.db"
-    return TagManager(db_path)
+    manager = TagManager(db_path)
+    yield manager
+    manager.close()
 
 def test_add_remove_tag(tag_manager, tmp_path):
     file1 = tmp_path / "file1.txt"
@@ -29,15 +31,12 @@ def test_get_files_by_tag(tag_manager, tmp_path):
     file1.touch()
     file2.touch()
 
-    tag_manager.add_tag(file1, "important")
-    tag_manager.add_tag(file2, "important")
+    tag_manager.add_tags([(file1, "important"), (file2, "important")])
 
     files = tag_manager.get_files_by_tag("important")
     assert len(files) == 2
-    # Check string representation because Path equality can be tricky with resolve()
-    paths = [str(p.resolve()) for p in files]
-    assert str(file1.resolve()) in paths
-    assert str(file2.resolve()) in paths
+    # Paths are stored resolved, so they compare equal without re-resolving
+    assert set(files) == {file1.resolve(), file2.resolve()}
 
 def test_list_all_tags(tag_manager, tmp_path):
     file1 = tmp_path / "file1.txt"
@@ -11,6 +11,7 @@ class TestTagManagerCleanup(unittest.TestCase):
         self.manager = TagManager(self.db_path)
 
     def tearDown(self):
+        self.manager.close()
         shutil.rmtree(self.test_dir)
 
     def test_cleanup_missing_files(self):
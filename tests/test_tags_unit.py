@@ -2,9 +2,17 @@ import pytest
 from src.file_manager.tags import TagManager
 
 @pytest.fixture
-def tag_manager(tmp_path):
-    db_path = tmp_path / "test_tags.db"
-    return TagManager(db_path)
+def tag_manager():
+    # Tagged files still live under tmp_path; only the database is in RAM
+    manager = TagManager(":memory:")
+    yield manager
+    manager.close()
+
+@pytest.fixture
+def file_tag_manager(tmp_path):
+    manager = TagManager(tmp_path / "test_tags.db")
+    yield manager
+    manager.close()
 
 def test_add_and_get_tag(tag_manager, tmp_path):
     file_path = tmp_path / "test_file.txt"
@@ -29,13 +37,12 @@ def test_get_files_by_tag(tag_manager, tmp_path):
     f1.touch()
     f2.touch()
 
-    tag_manager.add_tag(f1, "urgent")
-    tag_manager.add_tag(f2, "urgent")
+    assert tag_manager.add_tags([(f1, "urgent"), (f2, "urgent")]) == 2
 
     files = tag_manager.get_files_by_tag("urgent")
     assert len(files) == 2
-    # Check resolution
-    assert f1.resolve() in [f.resolve() for f in files]
+    # Paths are stored resolved, so they compare equal without re-resolving
+    assert f1.resolve() in set(files)
 
 def test_cleanup(tag_manager, tmp_path):
     f1 = tmp_path / "f1.txt"
@@ -47,3 +54,64 @@ def test_cleanup(tag_manager, tmp_path):
     deleted = tag_manager.cleanup_missing_files()
     assert deleted > 0
     assert len(tag_manager.get_files_by_tag("temp")) == 0
+
+def test_add_tags_batch(tag_manager, tmp_path):
+    f1 = tmp_path / "f1.txt"
+    f2 = tmp_path / "f2.txt"
+    f1.touch()
+    f2.touch()
+
+    added = tag_manager.add_tags([(f1, "work"), (f1, "urgent"), (f2, "work"), (f2, "  ")])
+    assert added == 3
+    # Duplicates are ignored
+    assert tag_manager.add_tags([(f1, "work")]) == 0
+
+    assert sorted(tag_manager.get_tags_for_file(f1)) == ["urgent", "work"]
+    assert len(tag_manager.get_files_by_tag("work")) == 2
+
+def test_connection_pragmas(file_tag_manager):
+    conn = file_tag_manager._connect()
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # 1 == NORMAL
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        # 2 == MEMORY
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+    finally:
+        conn.close()
+
+def test_tag_lookup_uses_covering_index(tag_manager):
+    with tag_manager._transaction() as conn:
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT file_path FROM tags WHERE tag = ?", ("x",)
+        ).fetchall()
+    assert "COVERING INDEX idx_tag_file" in plan[0][-1]
+
+def test_connection_is_shared_across_calls_and_threads(file_tag_manager, tmp_path):
+    import threading
+    f = tmp_path / "f.txt"
+    f.touch()
+    file_tag_manager.add_tag(f, "a")
+    conn = file_tag_manager._conn
+
+    worker = threading.Thread(target=file_tag_manager.add_tag, args=(f, "b"))
+    worker.start()
+    worker.join()
+
+    assert file_tag_manager._conn is conn
+    assert sorted(file_tag_manager.get_tags_for_file(f)) == ["a", "b"]
+
+    file_tag_manager.close()
+    assert file_tag_manager._conn is None
+    assert sorted(file_tag_manager.get_tags_for_file(f)) == ["a", "b"]
+
+def test_memory_manager_usable_after_close(tag_manager, tmp_path):
+    f1 = tmp_path / "f1.txt"
+    f1.touch()
+    tag_manager.add_tag(f1, "before")
+    tag_manager.close()
+
+    # The in-memory database starts over, but with its schema in place
+    assert tag_manager.list_all_tags() == []
+    assert tag_manager.add_tag(f1, "after")
+    assert tag_manager.get_tags_for_file(f1) == ["after"]
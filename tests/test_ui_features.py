@@ -1,9 +1,9 @@
 """
 Tests for UI features.
 """
-import pytest
+import pytest_asyncio
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
 
 from textual.widgets import Label
 from textual.app import App, ComposeResult
@@ -17,77 +17,101 @@ class TestApp(App):
     def compose(self) -> ComposeResult:
         yield Label("Test App")
 
-@pytest.mark.asyncio
-async def test_multi_select_directory_tree_selection():
+class PinnedCursorTree(MultiSelectDirectoryTree):
+    """Tree whose cursor_node can be pinned to a stand-in node."""
+
+    pinned_node = None
+
+    @property
+    def cursor_node(self):
+        if self.pinned_node is not None:
+            return self.pinned_node
+        return super().cursor_node
+
+
+# One headless app serves the whole module; each test mounts its widget into
+# it and the widget is removed again afterwards.
+@pytest_asyncio.fixture(scope="module")
+async def app_pilot():
+    app = TestApp()
+    async with app.run_test() as pilot:
+        yield app, pilot
+
+
+@pytest_asyncio.fixture
+async def mount_widget(app_pilot):
+    """Mount widgets into the shared app, returning (widget, pilot)."""
+    app, pilot = app_pilot
+    mounted = []
+
+    async def _mount(widget):
+        await app.mount(widget)
+        mounted.append(widget)
+        return widget, pilot
+
+    yield _mount
+    for widget in mounted:
+        await widget.remove()
+
+async def test_multi_select_directory_tree_selection(mount_widget):
     """Test selection logic in MultiSelectDirectoryTree."""
-    async with TestApp().run_test() as pilot:
-        tree = MultiSelectDirectoryTree("/")
-        await pilot.app.mount(tree)
-
-        # Mock cursor node
-        mock_node = MagicMock()
-        mock_node.data = MagicMock()
-        mock_node.data.path = Path("/tmp/file1")
-        mock_node.label = "file1"
-
-        with patch.object(MultiSelectDirectoryTree, 'cursor_node', new_callable=MagicMock) as mock_cursor_prop:
-            mock_cursor_prop.__get__ = MagicMock(return_value=mock_node)
-            tree.refresh = MagicMock()
-
-            # Toggle selection
-            tree.action_toggle_selection()
-            assert Path("/tmp/file1") in tree.selected_paths
-
-            # Toggle again (deselect)
-            tree.action_toggle_selection()
-            assert Path("/tmp/file1") not in tree.selected_paths
-
-@pytest.mark.asyncio
-async def test_file_preview_update():
+    tree, pilot = await mount_widget(PinnedCursorTree("/"))
+
+    tree.pinned_node = SimpleNamespace(
+        data=SimpleNamespace(path=Path("/tmp/file1")),
+        label="file1",
+        set_label=lambda label: None,
+    )
+    tree.refresh = lambda *args, **kwargs: None
+
+    # Toggle selection
+    tree.action_toggle_selection()
+    assert Path("/tmp/file1") in tree.selected_paths
+
+    # Toggle again (deselect)
+    tree.action_toggle_selection()
+    assert Path("/tmp/file1") not in tree.selected_paths
+
+    # Hand the cursor back before the tree next renders.
+    tree.pinned_node = None
+
+async def test_file_preview_update(mount_widget):
     """Test FilePreview widget content update."""
-    async with TestApp().run_test() as pilot:
-        preview = FilePreview()
-        await pilot.app.mount(preview)
+    preview, pilot = await mount_widget(FilePreview())
 
-        # In current design, preview loads via reactive path property
-        preview.path = None
-        await pilot.pause()
-        assert str(preview.render()) == ""
+    # In current design, preview loads via reactive path property
+    preview.path = None
+    await pilot.pause()
+    assert str(preview.render()) == ""
 
-@pytest.mark.asyncio
-async def test_status_bar_updates():
+async def test_status_bar_updates(mount_widget):
     """Test EnhancedStatusBar reactive properties."""
-    async with TestApp().run_test() as pilot:
-        bar = EnhancedStatusBar()
-        await pilot.app.mount(bar)
+    bar, pilot = await mount_widget(EnhancedStatusBar())
 
-        # Default state
-        assert bar.selection_count == 0
+    # Default state
+    assert bar.selection_count == 0
 
-        # Update properties
-        bar.selection_count = 5
-        bar.selection_size = 1024
+    # Update properties
+    bar.selection_count = 5
+    bar.selection_size = 1024
 
-        # Wait for reactive events
-        await pilot.pause()
+    # Wait for reactive events
+    await pilot.pause()
 
-        # Verify label update by checking child widget text
-        label = bar.query_one("#selection-info", Label)
-        assert "5 selected" in str(label.render())
+    # Verify label update by checking child widget text
+    label = bar.query_one("#selection-info", Label)
+    assert "5 selected" in str(label.render())
 
-@pytest.mark.asyncio
-async def test_help_overlay_search():
+async def test_help_overlay_search(mount_widget):
     """Test HelpOverlay search filtering."""
-    async with TestApp().run_test() as pilot:
-        overlay = HelpOverlay()
-        await pilot.app.mount(overlay)
+    overlay, pilot = await mount_widget(HelpOverlay())
 
-        # Wait for on_mount
-        await pilot.pause()
+    # Wait for on_mount
+    await pilot.pause()
 
-        # Test search
-        overlay.refresh_shortcuts("copy")
+    # Test search
+    overlay.refresh_shortcuts("copy")
 
-        # Verify container has children
-        container = overlay.query_one("#categories-container")
-        assert len(container.children) > 0
+    # Verify container has children
+    container = overlay.query_one("#categories-container")
+    assert len(container.children) > 0
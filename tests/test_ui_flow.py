@@ -1,15 +1,14 @@
-import pytest
 from pathlib import Path
 from textual.app import App, ComposeResult
 from textual.widgets import TabbedContent
 from src.file_manager.user_mode import UserModeScreen
 from src.file_manager.file_panel import MultiSelectDirectoryTree
+from src.file_manager.file_preview import FilePreview
 
 class HeadlessApp(App):
     def compose(self) -> ComposeResult:
         yield UserModeScreen()
 
-@pytest.mark.asyncio
 async def test_tabs_operation():
     app = HeadlessApp()
     async with app.run_test() as pilot:
@@ -27,12 +26,11 @@ async def test_tabs_operation():
         await pilot.press("ctrl+w")
         assert tabs.active == "tab-0"
 
-@pytest.mark.asyncio
 async def test_preview_toggle():
     app = HeadlessApp()
     async with app.run_test() as pilot:
         screen = app.query_one(UserModeScreen)
-        preview = screen.query_one("#preview-pane")
+        preview = screen.query_one(FilePreview)
 
         assert not screen.show_preview
         assert "visible" not in preview.classes
@@ -44,12 +42,11 @@ async def test_preview_toggle():
         await pilot.press("p")
         assert not screen.show_preview
 
-@pytest.mark.asyncio
 async def test_preview_pane_state_persists():
     app = HeadlessApp()
     async with app.run_test() as pilot:
         screen = app.query_one(UserModeScreen)
-        preview = screen.query_one("#preview-pane")
+        preview = screen.query_one(FilePreview)
 
         # Open preview
         await pilot.press("p")
@@ -64,7 +61,6 @@ async def test_preview_pane_state_persists():
         assert screen.show_preview
         assert "visible" in preview.classes
 
-@pytest.mark.asyncio
 async def test_multi_selection_logic():
     app = HeadlessApp()
     async with app.run_test() as pilot:
@@ -81,7 +77,6 @@ async def test_multi_selection_logic():
 
         assert len(tree.selected_paths) == 0
 
-@pytest.mark.asyncio
 async def test_range_selection_logic():
     app = HeadlessApp()
     async with app.run_test() as pilot:
@@ -102,7 +97,6 @@ async def test_range_selection_logic():
 
         assert len(tree.selected_paths) > 0
 
-@pytest.mark.asyncio
 async def test_tab_switching():
     app = HeadlessApp()
     async with app.run_test() as pilot:
@@ -1,8 +1,15 @@
 import unittest
-from unittest.mock import patch
-from src.file_manager.utils import find_gemini_executable
+from unittest.mock import call, patch
+import threading
+from src.file_manager.utils import find_gemini_executable, get_shared_pool, map_in_pool
 
 class TestFindGeminiExecutable(unittest.TestCase):
+    def setUp(self):
+        find_gemini_executable.cache_clear()
+
+    def tearDown(self):
+        find_gemini_executable.cache_clear()
+
     @patch('src.file_manager.utils.shutil.which')
     def test_find_gemini_standard(self, mock_which):
         """Test finding 'gemini' executable."""
@@ -35,8 +42,7 @@ class TestFindGeminiExecutable(unittest.TestCase):
         result = find_gemini_executable()
         self.assertEqual(result, "/data/data/com.termux/files/usr/bin/gemini-cli-termux")
         # Ensure it was called for both
-        mock_which.assert_any_call("gemini")
-        mock_which.assert_any_call("gemini-cli-termux")
+        mock_which.assert_has_calls([call("gemini"), call("gemini-cli-termux")], any_order=True)
 
     @patch('src.file_manager.utils.shutil.which')
     def test_find_gemini_none(self, mock_which):
@@ -45,9 +51,41 @@ class TestFindGeminiExecutable(unittest.TestCase):
 
         result = find_gemini_executable()
         self.assertIsNone(result)
-        # Ensure it tried both
-        mock_which.assert_any_call("gemini")
-        mock_which.assert_any_call("gemini-cli-termux")
+        # Ensure it tried both, once each
+        mock_which.assert_has_calls([call("gemini"), call("gemini-cli-termux")], any_order=True)
+        self.assertEqual(mock_which.call_count, 2)
+
+    @patch('src.file_manager.utils.shutil.which')
+    def test_find_gemini_candidate_order(self, mock_which):
+        """The standard install is probed before the Termux package."""
+        mock_which.return_value = None
+
+        find_gemini_executable()
+        probed = tuple(c.args[0] for c in mock_which.call_args_list)
+        self.assertEqual(probed, ("gemini", "gemini-cli-termux"))
+
+    @patch('src.file_manager.utils.shutil.which')
+    def test_find_gemini_cached(self, mock_which):
+        """Repeated lookups reuse the first PATH search."""
+        mock_which.return_value = None
+
+        self.assertIsNone(find_gemini_executable())
+        self.assertIsNone(find_gemini_executable())
+        # Both names were searched once, on the first call only
+        self.assertEqual(mock_which.call_count, 2)
+
+class TestMapInPool(unittest.TestCase):
+    def test_results_keep_input_order(self):
+        items = list(range(200))
+        self.assertEqual(map_in_pool(lambda x: x * 2, items, 16), [x * 2 for x in items])
+
+    def test_single_batch_runs_inline(self):
+        caller = threading.current_thread()
+        threads = map_in_pool(lambda _: threading.current_thread(), [1, 2, 3], 8)
+        self.assertTrue(all(t is caller for t in threads))
+
+    def test_shared_pool_is_reused(self):
+        self.assertIs(get_shared_pool(), get_shared_pool())
 
 if __name__ == '__main__':
     unittest.main()